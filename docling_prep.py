@@ -24,6 +24,9 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import collections
+import functools
+import itertools
 import json
 import os
 import shutil
@@ -53,6 +56,17 @@ DEFAULT_MIN_TOTAL_CHARS = 800      # "too empty" if fewer total chars than this
 # When to consider VLM fallback appropriate:
 VLM_ELIGIBLE_EXTS = {".pdf", ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".webp"}
 
+# Thread-count env vars honoured by the numerical libs docling spawns (torch/OpenMP/MKL).
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "TORCH_NUM_THREADS")
+
+# Number of most recent completions used for the rolling throughput/ETA estimate.
+RATE_WINDOW = 32
+
+# Per-worker-thread state (CPU group assigned by the pool initializer).
+_worker_state = threading.local()
+_worker_slots = itertools.count()
+_worker_slots_lock = threading.Lock()
+
 
 @dataclass
 class JobResult:
@@ -67,13 +81,50 @@ class JobResult:
     duration_sec: float = 0.0
 
 
-def run_cmd(cmd: List[str], cwd: Optional[Path] = None, stream: bool = False) -> Tuple[int, str, str]:
-    if stream:
-        # Stream to parent stdout/stderr
-        p = subprocess.run(cmd, text=True, shell=False, cwd=str(cwd) if cwd else None)
-        return p.returncode, "", ""
-    p = subprocess.run(cmd, capture_output=True, text=True, shell=False, cwd=str(cwd) if cwd else None)
-    return p.returncode, p.stdout, p.stderr
+def run_cmd(
+    cmd: List[str],
+    cwd: Optional[Path] = None,
+    stream: bool = False,
+    env: Optional[Dict[str, str]] = None,
+    cpus: Optional[List[int]] = None,
+) -> Tuple[int, str, str]:
+    # Stream to parent stdout/stderr when requested, otherwise capture.
+    pipe = None if stream else subprocess.PIPE
+    # Pin in the child before exec, so every thread docling starts inherits the mask.
+    pin = (lambda: os.sched_setaffinity(0, cpus)) if cpus else None
+    p = subprocess.Popen(cmd, stdout=pipe, stderr=pipe, text=True, shell=False,
+                         cwd=str(cwd) if cwd else None, env=env, preexec_fn=pin)
+    out, err = p.communicate()
+    return p.returncode, out or "", err or ""
+
+
+def partition_cpus(workers: int, threads_per_worker: int) -> List[List[int]]:
+    """
+    Split the CPUs available to this process into disjoint groups of
+    `threads_per_worker`, one per worker. Returns [] when pinning is unsupported
+    (non-Linux) or the groups would not fit without overlapping.
+    """
+    if not hasattr(os, "sched_getaffinity") or workers < 1 or threads_per_worker < 1:
+        return []
+    cpus = sorted(os.sched_getaffinity(0))
+    if workers * threads_per_worker > len(cpus):
+        return []
+    return [cpus[i * threads_per_worker:(i + 1) * threads_per_worker] for i in range(workers)]
+
+
+def _pin_worker(cpu_groups: List[List[int]]) -> None:
+    """ThreadPoolExecutor initializer: give each worker thread its own CPU group."""
+    with _worker_slots_lock:
+        slot = next(_worker_slots)
+    _worker_state.cpus = cpu_groups[slot % len(cpu_groups)] if cpu_groups else None
+
+
+def build_docling_env(num_threads: int) -> Dict[str, str]:
+    """Copy of os.environ with numerical-lib thread counts capped to num_threads."""
+    env = dict(os.environ)
+    for var in THREAD_ENV_VARS:
+        env[var] = str(num_threads)
+    return env
 
 
 def count_alpha_chars(text: str) -> int:
@@ -87,13 +138,33 @@ def safe_read_text(path: Path) -> str:
         return ""
 
 
-def format_duration(seconds: float) -> str:
-    seconds = max(0, int(seconds))
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
     h, rem = divmod(seconds, 3600)
     m, s = divmod(rem, 60)
     return f"{h:d}:{m:02d}:{s:02d}"
 
 
+def format_duration(seconds: float) -> str:
+    # Cache on whole seconds so heartbeat and status lines share formatted strings.
+    return _format_whole_seconds(max(0, int(seconds)))
+
+
+def rolling_rate(finish_times: "collections.deque[float]", now: float, start_time: float) -> float:
+    """
+    Files/sec over the most recent completions (monotonic timestamps).
+    Until the window fills, measure from start_time so early ETAs still work.
+    """
+    n = len(finish_times)
+    if n == 0:
+        return 0.0
+    if finish_times.maxlen is not None and n >= finish_times.maxlen:
+        span, count = now - finish_times[0], n - 1
+    else:
+        span, count = now - start_time, n
+    return count / span if span > 0 else 0.0
+
+
 def is_output_low_quality(md_text: str, min_alpha: int, min_total: int) -> bool:
     if not md_text:
         return True
@@ -104,6 +175,25 @@ def is_output_low_quality(md_text: str, min_alpha: int, min_total: int) -> bool:
     return False
 
 
+def md_is_low_quality(md_path: Optional[Path], min_alpha: int, min_total: int, requested: bool) -> bool:
+    """
+    Quality check for a produced markdown file using a single stat.
+    A file smaller than min_total bytes cannot hold min_total chars, so it is
+    rejected without being read; only borderline/large files are opened.
+    """
+    if not requested:
+        return False
+    if md_path is None:
+        return True
+    try:
+        st = os.stat(md_path)
+    except OSError:
+        return True
+    if st.st_size < min_total:
+        return True
+    return is_output_low_quality(safe_read_text(md_path), min_alpha=min_alpha, min_total=min_total)
+
+
 def find_output_file(out_dir: Path, src: Path, suffix: str) -> Optional[Path]:
     """
     Try to find the docling-produced output corresponding to src within out_dir.
@@ -283,11 +373,13 @@ def convert_one(
     min_alpha_chars: int,
     min_total_chars: int,
     ocr_retry_engine: str,
+    env: Optional[Dict[str, str]] = None,
 ) -> JobResult:
 
-    t0 = time.time()
+    t0 = time.monotonic()
     out_dir = compute_output_subdir(out_root, in_root, src)
     out_dir.mkdir(parents=True, exist_ok=True)
+    cpus = getattr(_worker_state, "cpus", None)
 
     def run_and_collect(pipeline: str, force_ocr: bool, ocr_engine_use: str) -> Tuple[int, str, str, Optional[Path], Optional[Path]]:
         cmd = build_docling_cmd(
@@ -313,7 +405,7 @@ def convert_one(
             debug_tables=debug_tables,
             verbose=verbose,
         )
-        rc, out, err = run_cmd(cmd, stream=(verbose > 0))
+        rc, out, err = run_cmd(cmd, stream=(verbose > 0), env=env, cpus=cpus)
         md_path = find_output_file(out_dir, src, ".md") if "md" in to_formats else None
         json_path = find_output_file(out_dir, src, ".json") if "json" in to_formats else None
         return rc, out, err, md_path, json_path
@@ -324,8 +416,8 @@ def convert_one(
         return JobResult(src=src, ok=False, reason=f"docling failed (pass1 {primary_pipeline}): {err1.strip()[:500]}", out_dir=out_dir)
 
     # Quality check (only if md produced)
-    md_text = safe_read_text(md1) if md1 and md1.exists() else ""
-    low_q = is_output_low_quality(md_text, min_alpha=min_alpha_chars, min_total=min_total_chars) if "md" in to_formats else False
+    md_requested = "md" in to_formats
+    low_q = md_is_low_quality(md1, min_alpha=min_alpha_chars, min_total=min_total_chars, requested=md_requested)
 
     used_force = False
     used_vlm = False
@@ -337,8 +429,7 @@ def convert_one(
             return JobResult(src=src, ok=False, reason=f"docling failed (pass2 force-ocr): {err2.strip()[:500]}", out_dir=out_dir)
         used_force = True
         md1, js1 = md2 or md1, js2 or js1
-        md_text = safe_read_text(md1) if md1 and md1.exists() else ""
-        low_q = is_output_low_quality(md_text, min_alpha=min_alpha_chars, min_total=min_total_chars) if "md" in to_formats else False
+        low_q = md_is_low_quality(md1, min_alpha=min_alpha_chars, min_total=min_total_chars, requested=md_requested)
 
     # Pass 3: optional VLM fallback (for PDFs/images only) if still low quality
     if low_q and vlm_fallback and src.suffix.lower() in VLM_ELIGIBLE_EXTS:
@@ -355,7 +446,7 @@ def convert_one(
     if "json" in to_formats and not (js1 and js1.exists()):
         missing_outputs.append("json")
 
-    duration = time.time() - t0
+    duration = time.monotonic() - t0
 
     if missing_outputs:
         return JobResult(
@@ -462,6 +553,8 @@ def main() -> int:
                     help="Parallel workers (each worker runs a docling process).")
     ap.add_argument("--docling-threads", type=int, default=4,
                     help="--num-threads passed to docling per document.")
+    ap.add_argument("--no-pin-workers", dest="pin_workers", action="store_false",
+                    help="Disable pinning each worker's docling process to its own CPU set (Linux only).")
     ap.add_argument("--device", default="auto", choices=["auto", "cpu", "cuda", "mps"],
                     help="Accelerator device.")
     ap.add_argument("-v", "--verbose", action="count", default=0,
@@ -508,12 +601,17 @@ def main() -> int:
     results: List[JobResult] = []
 
     total_jobs = len(worklist)
-    start_time = time.time()
+    start_time = time.monotonic()
+
+    workers = max(1, args.workers)
+    docling_env = build_docling_env(args.docling_threads)
+    cpu_groups = partition_cpus(workers, args.docling_threads) if args.pin_workers else []
 
     # Early status output so the user sees activity before first file completes
     print(
-        f"Starting {total_jobs} file(s) | workers={max(1, args.workers)} | threads/doc={args.docling_threads} "
-        f"| device={args.device} | pipeline={args.pipeline} | vlm_fallback={args.vlm_fallback}",
+        f"Starting {total_jobs} file(s) | workers={workers} | threads/doc={args.docling_threads} "
+        f"| device={args.device} | pipeline={args.pipeline} | vlm_fallback={args.vlm_fallback} "
+        f"| pinned={'yes' if cpu_groups else 'no'}",
         file=sys.stderr,
         flush=True,
     )
@@ -521,16 +619,20 @@ def main() -> int:
     # Heartbeat thread to emit periodic status before first completion
     heartbeat_stop = threading.Event()
     progress_state = {"completed": 0}
+    recent: "collections.deque[float]" = collections.deque(maxlen=RATE_WINDOW)
 
     def heartbeat() -> None:
         while not heartbeat_stop.wait(10):
             completed = progress_state["completed"]
-            elapsed = time.time() - start_time
-            rate = completed / elapsed if elapsed > 0 else 0
+            now = time.monotonic()
+            elapsed = now - start_time
+            avg_rate = completed / elapsed if elapsed > 0 else 0
+            recent_rate = rolling_rate(recent, now, start_time)
             remaining = total_jobs - completed
-            eta_seconds = remaining / rate if rate > 0 else 0
+            eta_seconds = remaining / recent_rate if recent_rate > 0 else 0
             print(
-                f"[heartbeat] [{completed}/{total_jobs}] elapsed={format_duration(elapsed)} eta={format_duration(eta_seconds)}",
+                f"[heartbeat] [{completed}/{total_jobs}] elapsed={format_duration(elapsed)} eta={format_duration(eta_seconds)} "
+                f"rate_avg={avg_rate * 60:.1f}/min rate_recent={recent_rate * 60:.1f}/min",
                 file=sys.stderr,
                 flush=True,
             )
@@ -538,7 +640,7 @@ def main() -> int:
     hb_thread = threading.Thread(target=heartbeat, daemon=True)
     hb_thread.start()
 
-    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as ex:
+    with ThreadPoolExecutor(max_workers=workers, initializer=_pin_worker, initargs=(cpu_groups,)) as ex:
         futs = []
         for src in worklist:
             pdf_pw = resolve_pdf_password(src, args.pdf_password, pw_map) if src.suffix.lower() == ".pdf" else None
@@ -569,6 +671,7 @@ def main() -> int:
                 min_alpha_chars=args.min_alpha_chars,
                 min_total_chars=args.min_total_chars,
                 ocr_retry_engine=args.ocr_retry_engine,
+                env=docling_env,
             ))
 
         completed = 0
@@ -576,9 +679,11 @@ def main() -> int:
             result = f.result()
             results.append(result)
             completed += 1
+            now = time.monotonic()
+            recent.append(now)
             progress_state["completed"] = completed
-            elapsed = time.time() - start_time
-            rate = completed / elapsed if elapsed > 0 else 0
+            elapsed = now - start_time
+            rate = rolling_rate(recent, now, start_time)
             remaining = total_jobs - completed
             eta_seconds = remaining / rate if rate > 0 else 0
             status_line = (
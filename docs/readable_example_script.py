@@ -6,17 +6,18 @@ Changes vs. the legacy script:
   signal operations easier to read and safer while keeping call order intact.
 - Wraps requirements into classes (`Requirement2A`, `Requirement2B`) but keeps
   the exact signal values, sleeps, logging, and test case numbering.
-- Keeps the import-time mocks so the file can still be imported on machines
+- Keeps import-time stubs so the file can still be imported on machines
   without proprietary `utilities` / `test_initialization` packages.
 """
 
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass  # @dataclass generates init/eq/repr; frozen=True makes it immutable.
-from contextlib import contextmanager  # @contextmanager turns a generator into a with-statement helper.
-from typing import Dict, Any
-from unittest.mock import Mock
+import types
+from dataclasses import dataclass, fields  # @dataclass generates init/eq/repr; frozen=True makes it immutable.
+from contextlib import contextmanager, nullcontext  # @contextmanager turns a generator into a with-statement helper.
+from functools import lru_cache
+from types import MappingProxyType
 
 
 # Template/script metadata mirrors the original
@@ -26,12 +27,31 @@ $CC_VERSION$  \main\13
 '''
 
 
-# --- Imports & mocking (kept to mirror original behavior) --------------------
-# NOTE: These mocks mask missing proprietary packages at import time. That is
-# exactly what the original file did. We keep it for fidelity, even though
-# fail-fast imports are usually safer in production.
-sys.modules['utilities'] = Mock()
-sys.modules['test_initialization'] = Mock()
+# --- Imports & stubbing (kept to mirror original behavior) -------------------
+# NOTE: These stubs mask missing proprietary packages at import time, as the
+# original Mock() injection did, even though fail-fast imports are usually
+# safer in production. Plain no-op functions for just the names this script
+# uses are cheaper than Mock, which builds a child mock per attribute, and a
+# module that is already loaded (e.g. a dry-run fake) is left in place.
+def _noop(*args, **kwargs):
+    return None
+
+
+if 'utilities' not in sys.modules:
+    _utilities = types.ModuleType('utilities')
+    for _name in ('AssembleLogheader', 'CheckSignal', 'CloseLogFile', 'ErrorCount',
+                  'GatherScriptInfo', 'GetScriptName', 'OpenLogFile', 'PostProcess',
+                  'SetSignal', 'SetTestCase', 'StartRecording', 'StopRecording',
+                  'WriteToLog', 'sleep'):
+        setattr(_utilities, _name, _noop)
+    _utilities.init_module = types.SimpleNamespace(start_rig=_noop)
+    _utilities.down_module = types.SimpleNamespace(stop_rig=_noop)
+    sys.modules['utilities'] = _utilities
+
+if 'test_initialization' not in sys.modules:
+    _test_initialization = types.ModuleType('test_initialization')
+    _test_initialization.standard_init = _noop
+    sys.modules['test_initialization'] = _test_initialization
 
 import utilities as u
 import test_initialization
@@ -51,21 +71,85 @@ class RunConfig:
     rec_id_2b: str = 's3_2_2_1_3_1_2_2__2b'
     rec_freq_hz: int = 32
 
+    # Skip Harness.set_many writes whose value matches the last one written
+    # since the last sleep or wait. Every write goes through the harness so
+    # this memory stays accurate. Off by default: the unit can change a
+    # signal behind the script's back (the repeated default_flag_loc = 0
+    # writes re-arm it), so only enable it for a test once that is ruled out.
+    dedupe_writes: bool = False
+
 
 class Harness:
     """Tiny wrapper around utilities to shrink repetition."""
 
-    def set_many(self, pairs: Dict[str, Any]) -> None:
+    def __init__(self, dedupe_writes: bool = False):
+        self.dedupe_writes = dedupe_writes
+        self._last_written: dict[str, object] = {}
+
+    # Newer utilities builds take a whole group of signals in one driver
+    # round-trip (SetSignals/CheckSignals, the same calls example_script.py
+    # uses). Looked up per call (not at import) because the module may
+    # be swapped for a fake in dry-runs.
+    # Older builds fall back to one SetSignal/CheckSignal per signal, in
+    # dict order, exactly as before.
+    def set_many(self, pairs: dict[str, object]) -> None:
+        if self.dedupe_writes:
+            last = self._last_written
+            pairs = {sig: val for sig, val in pairs.items() if sig not in last or last[sig] != val}
+            if not pairs:
+                return
+            last.update(pairs)
+        batch = getattr(u, 'SetSignals', None)
+        if batch is not None:
+            batch(pairs)
+            return
+        set_signal = u.SetSignal
         for sig, val in pairs.items():
-            u.SetSignal(sig, val)
+            set_signal(sig, val)
 
-    def check_many(self, pairs: Dict[str, Any]) -> None:
+    def check_many(self, pairs: dict[str, object]) -> None:
+        batch = getattr(u, 'CheckSignals', None)
+        if batch is not None:
+            batch(pairs)
+            return
+        check_signal = u.CheckSignal
         for sig, val in pairs.items():
-            u.CheckSignal(sig, val)
+            check_signal(sig, val)
 
+    # Any wait lets the rig move signals on, so it forgets what was written.
     def settle(self, seconds: float = 1.0) -> None:
+        self._last_written.clear()
         u.sleep(seconds)
 
+    # Builds with WaitForSignals poll the rig (with backoff) and return as
+    # soon as every signal matches; others fall back to the fixed wait the
+    # legacy script used. The poll loop lives in utilities because only it
+    # knows whether the rig clock is real or simulated. Callers still check
+    # the signals afterwards, so a timeout is reported as a failed check.
+    def wait_for(self, pairs: dict[str, object], timeout: float = 1) -> None:
+        self._last_written.clear()
+        wait = getattr(u, 'WaitForSignals', None)
+        if wait is not None:
+            wait(pairs, timeout=timeout)
+            return
+        u.sleep(timeout)
+
+
+class CaseCounter:
+    """Test case numbering for one test point, shared across channels."""
+
+    __slots__ = ('testpoint', 'n')
+
+    def __init__(self, testpoint: int):
+        self.testpoint = testpoint
+        self.n = 0
+
+    def advance(self, case_type: str = 'normal') -> int:
+        """Increment and register the next testcase number with the harness."""
+        self.n += 1
+        u.SetTestCase(self.testpoint, self.n, type=case_type)
+        return self.n
+
 
 class RunContext:
     """Owns script lifecycle: rig on/off, logging, init, recording."""
@@ -73,37 +157,44 @@ class RunContext:
     def __init__(self, config: RunConfig, script_name: str):
         self.config = config
         self.script_name = script_name
-        self.h = Harness()
+        self.h = Harness(dedupe_writes=config.dedupe_writes)
 
     @contextmanager
     def script_scope(self):
-        started_rig = False
-        log_open = False
+        # Cleanup callables are resolved as each resource is acquired, so the
+        # finally block does no lookups that could fail and mask the original
+        # exception; None means that resource was never acquired.
+        stop_rig = None
+        close_log = None
         try:
             if self.config.pwr_start_stop:
+                rig_stop = u.down_module.stop_rig
                 u.init_module.start_rig()
-                started_rig = True
+                stop_rig = rig_stop
 
+            log_close = u.CloseLogFile
             u.OpenLogFile(self.script_name)
-            log_open = True
+            close_log = log_close
             yield
         finally:
-            if log_open:
+            if close_log is not None:
                 try:
-                    u.CloseLogFile()
+                    close_log()
                 except Exception:
                     pass
-            if started_rig:
+            if stop_rig is not None:
                 try:
-                    u.down_module.stop_rig()
+                    stop_rig()
                 except Exception:
                     pass
 
-    @contextmanager
     def recording(self, rec_id: str):
         if not self.config.record_data:
-            yield
-            return
+            return nullcontext()
+        return self._recording(rec_id)
+
+    @contextmanager
+    def _recording(self, rec_id: str):
         u.StartRecording(rec_id, screen_name=rec_id, rec_freq_hz=self.config.rec_freq_hz)
         try:
             yield
@@ -121,6 +212,146 @@ class RunContext:
         u.ErrorCount()
 
 
+# Fixed per-channel signal names shared by Requirement2A and Requirement2B.
+# Each field name is the bare signal name; the value carries the UUT prefix.
+@dataclass(frozen=True)
+class ChannelSignals:
+    k_css_no_info_time: str
+    k_disable_all_label_aquisition_inputs: str
+    k_disable_all_can_inputs: str
+    aircraft_type: str
+    controller_side: str
+    channel_number: str
+    fd_sw_app_l_test_data: str
+    fd_sw_app_r_test_data: str
+    eicas_l_test_data: str
+    eicas_r_test_data: str
+    adiru_l_test_data: str
+    adiru_r_test_data: str
+    gnd_test_sw_app_l_test_data: str
+    gnd_test_sw_app_r_test_data: str
+    fd_sw_app_lss_test_data: str
+    fd_sw_app_lss_test_data_oc: str
+    eicas_lss_test_data: str
+    eicas_lss_test_data_oc: str
+    adiru_lss_test_data: str
+    adiru_lss_test_data_oc: str
+    gnd_test_sw_app_lss_test_data: str
+    gnd_test_sw_app_lss_test_data_oc: str
+    fd_sw_app_p_test_data: str
+    eicas_p_test_data: str
+    adiru_p_test_data: str
+    gnd_test_sw_app_p_test_data: str
+
+
+@lru_cache(maxsize=None)
+def _channel_signals(uut_base: str) -> ChannelSignals:
+    """Build the prefixed names for one UUT once per import."""
+    prefix = uut_base + '::'
+    return ChannelSignals(**{f.name: prefix + f.name for f in fields(ChannelSignals)})
+
+
+# Orange per-parameter banner, keyed by output parameter name (read-only).
+# The legacy ladders fall back differently: the opening banner defaults to
+# Flow_Priority_Sw, the closing one to Total_Air_Temp (flow_priority_sw
+# included), so each call site passes its own default.
+_FLOW_PRIORITY_SW_LABEL = '---- For Parameter Flow_Priority_Sw ----'
+_TOTAL_AIR_TEMP_LABEL = '---- For Parameter Total_Air_Temp ----'
+_OP_LABEL = MappingProxyType({
+    'flight_phase': '---- For Parameter Flight_Phase ----',
+    'baro_altitude': '---- For Parameter Baro_Altitude ----',
+    'gnd_speed': '---- For Parameter Gnd_Speed ----',
+    'equip_cool_sw': '---- For Parameter Equip_Cool_Sw ----',
+    'gnd_test_data_load_sw': '---- For Parameter Gnd_Test_Data_Load_Sw ----',
+    'engine_run': '---- For Parameter Engine_Run ----',
+    'total_air_temp': _TOTAL_AIR_TEMP_LABEL,
+})
+
+
+# Requirement 2a inputs, built once at import instead of on every run().
+_REQT_2A_UUTS = ('lctc1',)
+_REQT_2A_AIRCRAFT_TYPES = ('passenger', 'freighter')
+
+# One row per parameter: (validity1, parameter1, resolution, validity2,
+# parameter2, defaultflag, opV, opP, inputdata, primV, secV, lesstol,
+# set_value1, initial_value, defaultflagloc). Fractions such as 1/64 are
+# folded to float constants by the compiler.
+_VALIDITY_ROWS = (
+    ('flight_phase_lss_v', 'flight_phase_lss', 1, 'flight_phase_lss_v_oc',
+     'flight_phase_lss_oc', 'flight_phase_data_def', 'flight_phase_v',
+     'flight_phase', 'l_409_w03_p_raw', 'flight_phase_p_v',
+     'flight_phase_s_v', 3, 1, 7, 'flight_number_p1_data_def'),
+    ('baro_altitude_lss_v', 'baro_altitude_lss', 0.01, 'baro_altitude_lss_v_oc',
+     'baro_altitude_lss_oc', 'baro_altitude_data_def', 'baro_altitude_v',
+     'baro_altitude', 'l_70a_w04_p_raw', 'baro_altitude_p_v',
+     'baro_altitude_s_v', 121, 512, 22, 'baro_altitude_lss_data_def'),
+    ('gnd_speed_lss_v', 'gnd_speed_lss', 0.125, 'gnd_speed_lss_v_oc',
+     'gnd_speed_lss_oc', 'gnd_speed_data_def', 'gnd_speed_v',
+     'gnd_speed', 'l_eae_w11_p_raw', 'gnd_speed_p_v',
+     'gnd_speed_s_v', 13, 128, 0, 'gnd_speed_lss_data_def'),
+    ('equip_cool_sw_lss_v', 'equip_cool_sw_lss', 1/64, 'equip_cool_sw_lss_v_oc',
+     'equip_cool_sw_lss_oc', 'equip_cool_sw_def', 'equip_cool_sw_v',
+     'equip_cool_sw', 'l_e77_w03_p_raw', 'equip_cool_and_voc_p_v',
+     'equip_cool_and_voc_s_v', 3, 64, 2, 'equip_cool_sw_lss_def'),
+    ('gnd_test_data_load_sw_lss_v', 'gnd_test_data_load_sw_lss', 1/256,
+     'gnd_test_data_load_sw_lss_v_oc', 'gnd_test_data_load_sw_lss_oc',
+     'gnd_test_data_load_sw_def', 'gnd_test_data_load_sw_v',
+     'gnd_test_data_load_sw', 'l_ea4_w02_p_raw', 'gnd_test_data_load_p_v',
+     'gnd_test_data_load_s_v', 1, 1024, 2, 'gnd_test_data_load_sw_lss_def'),
+    ('engine_run_lss_v', 'engine_run_lss', 1/2048,
+     'engine_run_lss_v_oc', 'engine_run_lss_oc',
+     'engine_run_data_def', 'engine_run_v', 'engine_run',
+     'l_eb0_w10_p_raw', 'engine_running_l_p_v', 'engine_running_l_s_v',
+     1, 2048, 0, 'engine_idle_l_def'),
+    ('total_air_temp_lss_v', 'total_air_temp_lss', 0.125,
+     'total_air_temp_lss_v_oc', 'total_air_temp_lss_oc',
+     'total_air_temp_data_def', 'total_air_temp_v', 'total_air_temp',
+     'l_fed_w07_p_raw', 'total_air_temp_p_v', 'total_air_temp_s_v',
+     -15.0, 1024, -100.0, 'total_air_temp_lss_data_def'),
+    ('flow_priority_sw_lss_v', 'flow_priority_sw_lss', 2/512,
+     'flow_priority_sw_lss_v_oc', 'flow_priority_sw_lss_oc',
+     'flow_priority_sw_def', 'flow_priority_sw_v', 'flow_priority_sw',
+     'l_e77_w03_p_raw', 'equip_cool_and_voc_p_v', 'equip_cool_and_voc_s_v',
+     0, 512, 0, 'flow_priority_sw_lss_def'),
+)
+
+
+def _expected_output(resolution: float, set_value1: float, initial_value: float) -> float:
+    """Value the output parameter should settle to once the local input is valid."""
+    if resolution == 0.125 and initial_value == -100.0:
+        return (64 * resolution * 1.8) + 32.0
+    if resolution == 0.01:
+        return 64 * resolution
+    return set_value1 * resolution
+
+
+# Same rows with the expected output appended, computed once per parameter
+# instead of once per row per channel and aircraft type.
+_VALIDITY_TABLE = tuple(
+    row + (_expected_output(row[2], row[12], row[13]),) for row in _VALIDITY_ROWS
+)
+
+
+@dataclass(frozen=True)
+class VerificationCase:
+    """One Requirement 2a verification case: set inputs, wait, verify."""
+
+    name: str
+    setup: dict[str, object]
+    verify_cond: dict[str, object]
+    verify_out: dict[str, object]
+    wait_s: float = 1
+    case_type: str = 'normal'
+    # Cases e, f, g and i straddle K_CSS_No_Info_Time: the hold checks sample
+    # the outputs before it expires (right after wait_s for e/i, after the
+    # output banner for f/g) and the rest follows hold_s later. The two
+    # waits cannot be folded into one because the checked values change.
+    hold_cond: dict[str, object] | None = None
+    hold_out: dict[str, object] | None = None
+    hold_s: float = 2
+    post_process: str | None = None
+
+
 class Requirement2A:
     """Requirement 2a: validity flag and data parameter logic (behavior preserved)."""
 
@@ -129,427 +360,483 @@ class Requirement2A:
         self.h = ctx.h
 
     def run(self) -> None:
-        testcase = 0
-        UUT_list = ['lctc1']
-        aircraft_type_list = ['passenger', 'freighter']
-        testpoint = 1
-        input_parameter_validity_table = [
-            ('flight_phase_lss_v', 'flight_phase_lss', 1, 'flight_phase_lss_v_oc',
-             'flight_phase_lss_oc', 'flight_phase_data_def', 'flight_phase_v',
-             'flight_phase', 'l_409_w03_p_raw', 'flight_phase_p_v',
-             'flight_phase_s_v', 3, 1, 7, 'flight_number_p1_data_def'),
-            ('baro_altitude_lss_v', 'baro_altitude_lss', 0.01, 'baro_altitude_lss_v_oc',
-             'baro_altitude_lss_oc', 'baro_altitude_data_def', 'baro_altitude_v',
-             'baro_altitude', 'l_70a_w04_p_raw', 'baro_altitude_p_v',
-             'baro_altitude_s_v', 121, 512, 22, 'baro_altitude_lss_data_def'),
-            ('gnd_speed_lss_v', 'gnd_speed_lss', 0.125, 'gnd_speed_lss_v_oc',
-             'gnd_speed_lss_oc', 'gnd_speed_data_def', 'gnd_speed_v',
-             'gnd_speed', 'l_eae_w11_p_raw', 'gnd_speed_p_v',
-             'gnd_speed_s_v', 13, 128, 0, 'gnd_speed_lss_data_def'),
-            ('equip_cool_sw_lss_v', 'equip_cool_sw_lss', 1/64, 'equip_cool_sw_lss_v_oc',
-             'equip_cool_sw_lss_oc', 'equip_cool_sw_def', 'equip_cool_sw_v',
-             'equip_cool_sw', 'l_e77_w03_p_raw', 'equip_cool_and_voc_p_v',
-             'equip_cool_and_voc_s_v', 3, 64, 2, 'equip_cool_sw_lss_def'),
-            ('gnd_test_data_load_sw_lss_v', 'gnd_test_data_load_sw_lss', 1/256,
-             'gnd_test_data_load_sw_lss_v_oc', 'gnd_test_data_load_sw_lss_oc',
-             'gnd_test_data_load_sw_def', 'gnd_test_data_load_sw_v',
-             'gnd_test_data_load_sw', 'l_ea4_w02_p_raw', 'gnd_test_data_load_p_v',
-             'gnd_test_data_load_s_v', 1, 1024, 2, 'gnd_test_data_load_sw_lss_def'),
-            ('engine_run_lss_v', 'engine_run_lss', 1/2048,
-             'engine_run_lss_v_oc', 'engine_run_lss_oc',
-             'engine_run_data_def', 'engine_run_v', 'engine_run',
-             'l_eb0_w10_p_raw', 'engine_running_l_p_v', 'engine_running_l_s_v',
-             1, 2048, 0, 'engine_idle_l_def'),
-            ('total_air_temp_lss_v', 'total_air_temp_lss', 0.125,
-             'total_air_temp_lss_v_oc', 'total_air_temp_lss_oc',
-             'total_air_temp_data_def', 'total_air_temp_v', 'total_air_temp',
-             'l_fed_w07_p_raw', 'total_air_temp_p_v', 'total_air_temp_s_v',
-             -15.0, 1024, -100.0, 'total_air_temp_lss_data_def'),
-            ('flow_priority_sw_lss_v', 'flow_priority_sw_lss', 2/512,
-             'flow_priority_sw_lss_v_oc', 'flow_priority_sw_lss_oc',
-             'flow_priority_sw_def', 'flow_priority_sw_v', 'flow_priority_sw',
-             'l_e77_w03_p_raw', 'equip_cool_and_voc_p_v', 'equip_cool_and_voc_s_v',
-             0, 512, 0, 'flow_priority_sw_lss_def')
-        ]
-
-        for aircraft_type_signal in aircraft_type_list:
-            for uut_base in UUT_list:
-                testcase = self._run_for_channel(
+        cases = CaseCounter(testpoint=1)
+
+        for aircraft_type_signal in _REQT_2A_AIRCRAFT_TYPES:
+            for uut_base in _REQT_2A_UUTS:
+                self._run_for_channel(
                     uut_base,
                     aircraft_type_signal,
-                    input_parameter_validity_table,
-                    testpoint,
-                    testcase,
+                    _VALIDITY_TABLE,
+                    cases,
                 )
 
-    def _run_for_channel(self, uut_base: str, aircraft_type_signal: str, table, testpoint: int, testcase: int) -> int:
-        uut = f"{uut_base}::"
-        # Small helper closes over prefix so signal names stay consistent.
-        def s(name: str) -> str:
-            return f"{uut}{name}"
-
-        # Local testcase counter so numbering stays explicit and less error-prone.
-        case_no = testcase
-
-        def next_case(case_type: str = 'normal') -> int:
-            """Increment and register the next testcase number with the harness."""
-            nonlocal case_no
-            case_no += 1
-            u.SetTestCase(testpoint, case_no, type=case_type)
-            return case_no
-        u.WriteToLog('#-- Req 2a Test start for channel: ' + uut + ' for ' + aircraft_type_signal + '--#', color='green')
-        u.WriteToLog('Building the signals')
-
-        k_css_no_info_time = s('k_css_no_info_time')
-        k_disable_all_label_aquisition_inputs = s('k_disable_all_label_aquisition_inputs')
-        k_disable_all_can_inputs = s('k_disable_all_can_inputs')
-        aircraft_type = s('aircraft_type')
-
-        if aircraft_type_signal == 'freighter':
-            u.SetSignal(aircraft_type, 8)
-            u.sleep(1)
-            u.CheckSignal(aircraft_type, 8)
-        else:
-            u.SetSignal(aircraft_type, 7)
-            u.sleep(1)
-            u.CheckSignal(aircraft_type, 7)
-
-        u.SetSignal(k_disable_all_label_aquisition_inputs, 1)
-        u.SetSignal(k_disable_all_can_inputs, 1)
-        u.sleep(1)
-        u.CheckSignal(k_disable_all_label_aquisition_inputs, 1)
-        u.CheckSignal(k_disable_all_can_inputs, 1)
-
-        u.CheckSignal(k_css_no_info_time, 5)
+    def _run_for_channel(self, uut_base: str, aircraft_type_signal: str, table, cases: CaseCounter) -> None:
+        # Channel-wide names come from the shared per-UUT cache; the per-row
+        # names are built once per row with plain concatenation.
+        uut = uut_base + '::'
+
+        # Bound once: the row loop below makes dozens of these calls per row.
+        write_log = u.WriteToLog
+        check_signal = u.CheckSignal
+        sleep = self.h.settle
+
+        write_log('#-- Req 2a Test start for channel: ' + uut + ' for ' + aircraft_type_signal + '--#', color='green')
+        write_log('Building the signals')
+
+        cs = _channel_signals(uut_base)
+        k_css_no_info_time = cs.k_css_no_info_time
+        k_disable_all_label_aquisition_inputs = cs.k_disable_all_label_aquisition_inputs
+        k_disable_all_can_inputs = cs.k_disable_all_can_inputs
+        aircraft_type = cs.aircraft_type
+
+        # Loop-invariant for the whole channel run.
+        aircraft_expected = 8 if aircraft_type_signal == 'freighter' else 7
+        self.h.set_many({aircraft_type: aircraft_expected})
+        self.h.wait_for({aircraft_type: aircraft_expected})
+        check_signal(aircraft_type, aircraft_expected)
+
+        disable_flags = {
+            k_disable_all_label_aquisition_inputs: 1,
+            k_disable_all_can_inputs: 1,
+        }
+        self.h.set_many(disable_flags)
+        self.h.wait_for(disable_flags)
+        self.h.check_many(disable_flags)
+
+        check_signal(k_css_no_info_time, 5)
 
         for (validity1, parameter1, resolution, validity2, parameter2,
              defaultflag, opV, opP, inputdata, primV, secV, lesstol,
-             set_value1, initial_value, defaultflagloc) in table:
-
-            validity_local = s(validity1)
-            parameter_local = s(parameter1)
-            validity_oth = s(validity2)
-            parameter_oth = s(parameter2)
-            default_flag = s(defaultflag)
-            output_V = s(opV)
-            output_P = s(opP)
-            ctc_input_data = s(inputdata)
-            primary_V = s(primV)
-            secondary_V = s(secV)
-            default_flag_loc = s(defaultflagloc)
-
-            u.WriteToLog('---- Requirement 2a is Started----', color='green')
-            if opP == 'flight_phase':
-                u.WriteToLog('---- For Parameter Flight_Phase ----', color='orange')
-            elif opP == 'baro_altitude':
-                u.WriteToLog('---- For Parameter Baro_Altitude ----', color='orange')
-            elif opP == 'gnd_speed':
-                u.WriteToLog('---- For Parameter Gnd_Speed ----', color='orange')
-            elif opP == 'equip_cool_sw':
-                u.WriteToLog('---- For Parameter Equip_Cool_Sw ----', color='orange')
-            elif opP == 'gnd_test_data_load_sw':
-                u.WriteToLog('---- For Parameter Gnd_Test_Data_Load_Sw ----', color='orange')
-            elif opP == 'engine_run':
-                u.WriteToLog('---- For Parameter Engine_Run ----', color='orange')
-            elif opP == 'total_air_temp':
-                u.WriteToLog('---- For Parameter Total_Air_Temp ----', color='orange')
-            else:
-                u.WriteToLog('---- For Parameter Flow_Priority_Sw ----', color='orange')
-
-            u.WriteToLog('---- Check outputs are set to different value before checking their initial Test case value ----', color='green')
-            u.SetSignal(default_flag, 0)
-            u.SetSignal(primary_V, 0)
-            u.SetSignal(secondary_V, 0)
-            u.SetSignal(ctc_input_data, set_value1)
-            u.SetSignal(validity_oth, 1)
-            u.SetSignal(parameter_oth, lesstol)
-            u.sleep(1)
-            u.CheckSignal(validity_local, 0)
-
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, lesstol)
-            u.SetSignal(primary_V, 0)
-            u.SetSignal(validity_oth, 0)
-            u.sleep(1)
-            u.CheckSignal(primary_V, 0)
-            u.CheckSignal(validity_oth, 0)
-            u.CheckSignal(validity_local, 0)
-
-            u.CheckSignal(output_V, 0)
-            u.CheckSignal(output_P, lesstol)
-            u.CheckSignal(default_flag, 0)
-
-            next_case('normal')
-
-            u.WriteToLog(' ---- Setting the Test Condition for Verification case a ----', color='green')
-
-            u.SetSignal(primary_V, 1)
-            u.SetSignal(secondary_V, 0)
-            u.SetSignal(ctc_input_data, set_value1)
-            u.SetSignal(validity_oth, 0)
-            u.SetSignal(parameter_oth, lesstol)
-            u.sleep(1)
-            if resolution == 0.125 and initial_value == -100.0:
-                expected_output = (64 * resolution * 1.8) + 32.0
-            elif resolution == 0.01:
-                expected_output = 64 * resolution
-            else:
-                expected_output = set_value1 * resolution
-
-            u.WriteToLog(' ---- Verifying the Test Condition for Verification case a ----', color='green')
-            u.CheckSignal(parameter_local, expected_output)
-            u.CheckSignal(default_flag, 0)
-            u.CheckSignal(validity_local, 1)
-            u.CheckSignal(validity_oth, 0)
-            u.CheckSignal(parameter_oth, lesstol)
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.WriteToLog(' ---- Verifying the Output Signals for Verification case a ----', color='green')
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, expected_output)
-
-            next_case('normal')
-            u.WriteToLog(' ---- Setting the Test Condition for Verification case b ----', color='green')
-            u.SetSignal(primary_V, 0)
-            u.SetSignal(validity_oth, 1)
-            u.SetSignal(parameter_oth, lesstol)
-            u.sleep(1)
-
-            u.WriteToLog(' ---- Verifying the Test Condition for Verification case b ----', color='green')
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(parameter_local, expected_output)
-            u.CheckSignal(parameter_oth, lesstol)
-            u.CheckSignal(default_flag, 0)
-            u.CheckSignal(validity_local, 0)
-            u.CheckSignal(validity_oth, 1)
-
-            u.WriteToLog(' ---- Verifying the Output Signals for Verification case b ----', color='green')
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, lesstol)
-
-            u.SetSignal(default_flag_loc, 0)
-            u.SetSignal(primary_V, 0)
-            u.SetSignal(validity_oth, 0)
-            u.sleep(6)
-            u.CheckSignal(output_V, 0)
-            u.CheckSignal(output_P, initial_value)
-
-            next_case('normal')
-            u.WriteToLog(' ---- Setting the Test Condition for Verification case e ----', color='green')
-            u.SetSignal(default_flag_loc, 0)
-            u.SetSignal(primary_V, 1)
-            u.SetSignal(validity_oth, 0)
-            u.SetSignal(parameter_oth, lesstol)
-            u.sleep(4)
-
-            u.WriteToLog(' ---- Verifying the Test Condition for Verification case e ----', color='green')
-            u.CheckSignal(default_flag, 1)
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, initial_value)
-            u.sleep(2)
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(parameter_local, expected_output)
-            u.CheckSignal(primary_V, 1)
-            u.CheckSignal(ctc_input_data, set_value1)
-            u.CheckSignal(validity_local, 1)
-            u.CheckSignal(validity_oth, 0)
-            u.CheckSignal(parameter_oth, lesstol)
-            u.WriteToLog(' ---- Verifying the Output Signals for Verification case e ----', color='green')
-            u.PostProcess('Manually verify output_V, output_P and default_flag when validity_local is True for K_CSS_No_Info_Time seconds in csv record file s3_2_2_1_3_1_2_2__2a')
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, expected_output)
-            u.CheckSignal(default_flag, 0)
-
-            next_case('normal')
-            u.WriteToLog(' ---- Setting the Test Condition for Verification case c and d ----', color='green')
-            u.SetSignal(primary_V, 0)
-            u.SetSignal(validity_oth, 0)
-            u.sleep(4)
-
-            u.WriteToLog(' ---- Verifying the Test Condition for Verification case c ----', color='green')
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(validity_oth, 0)
-            u.CheckSignal(default_flag, 0)
-            u.CheckSignal(validity_local, 0)
-
-            u.WriteToLog(' ---- Verifying the Output Signals for Verification case c ----', color='green')
-            u.CheckSignal(output_V, 0)
-            u.CheckSignal(output_P, expected_output)
-
-            u.WriteToLog(' ---- Verifying the Test Condition for Verification case d ----', color='green')
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(validity_oth, 0)
-            u.CheckSignal(default_flag, 0)
-            u.CheckSignal(validity_local, 0)
-            u.sleep(2)
-            u.WriteToLog(' ---- Verifying the Output Signals for Verification case d ----', color='green')
+             set_value1, initial_value, defaultflagloc, expected_output) in table:
+
+            validity_local = uut + validity1
+            parameter_local = uut + parameter1
+            validity_oth = uut + validity2
+            parameter_oth = uut + parameter2
+            default_flag = uut + defaultflag
+            output_V = uut + opV
+            output_P = uut + opP
+            ctc_input_data = uut + inputdata
+            primary_V = uut + primV
+            secondary_V = uut + secV
+            default_flag_loc = uut + defaultflagloc
+
+            write_log('---- Requirement 2a is Started----', color='green')
+            write_log(_OP_LABEL.get(opP, _FLOW_PRIORITY_SW_LABEL), color='orange')
+
+            write_log('---- Check outputs are set to different value before checking their initial Test case value ----', color='green')
+            self.h.set_many({
+                default_flag: 0,
+                primary_V: 0,
+                secondary_V: 0,
+                ctc_input_data: set_value1,
+                validity_oth: 1,
+                parameter_oth: lesstol,
+            })
+            sleep(1)
+            check_signal(validity_local, 0)
+
+            self.h.check_many({
+                output_V: 1,
+                output_P: lesstol,
+            })
+            self.h.set_many({
+                primary_V: 0,
+                validity_oth: 0,
+            })
+            sleep(1)
+            self.h.check_many({
+                primary_V: 0,
+                validity_oth: 0,
+                validity_local: 0,
+            })
+
+            self.h.check_many({
+                output_V: 0,
+                output_P: lesstol,
+                default_flag: 0,
+            })
+
+            self._run_case(VerificationCase(
+                name='a',
+                setup={
+                    primary_V: 1,
+                    secondary_V: 0,
+                    ctc_input_data: set_value1,
+                    validity_oth: 0,
+                    parameter_oth: lesstol,
+                },
+                verify_cond={
+                    parameter_local: expected_output,
+                    default_flag: 0,
+                    validity_local: 1,
+                    validity_oth: 0,
+                    parameter_oth: lesstol,
+                    aircraft_type: aircraft_expected,
+                },
+                verify_out={
+                    output_V: 1,
+                    output_P: expected_output,
+                },
+            ), cases)
+
+            self._run_case(VerificationCase(
+                name='b',
+                setup={
+                    primary_V: 0,
+                    validity_oth: 1,
+                    parameter_oth: lesstol,
+                },
+                verify_cond={
+                    aircraft_type: aircraft_expected,
+                    parameter_local: expected_output,
+                    parameter_oth: lesstol,
+                    default_flag: 0,
+                    validity_local: 0,
+                    validity_oth: 1,
+                },
+                verify_out={
+                    output_V: 1,
+                    output_P: lesstol,
+                },
+            ), cases)
+
+            reset_state = {
+                default_flag_loc: 0,
+                primary_V: 0,
+                validity_oth: 0,
+            }
+            self.h.set_many(reset_state)
+            sleep(6)
+            self.h.check_many({
+                output_V: 0,
+                output_P: initial_value,
+            })
+
+            self._run_case(VerificationCase(
+                name='e',
+                setup={
+                    default_flag_loc: 0,
+                    primary_V: 1,
+                    validity_oth: 0,
+                    parameter_oth: lesstol,
+                },
+                wait_s=4,
+                hold_cond={
+                    default_flag: 1,
+                    output_V: 1,
+                    output_P: initial_value,
+                },
+                verify_cond={
+                    aircraft_type: aircraft_expected,
+                    parameter_local: expected_output,
+                    primary_V: 1,
+                    ctc_input_data: set_value1,
+                    validity_local: 1,
+                    validity_oth: 0,
+                    parameter_oth: lesstol,
+                },
+                post_process='Manually verify output_V, output_P and default_flag when validity_local is True for K_CSS_No_Info_Time seconds in csv record file s3_2_2_1_3_1_2_2__2a',
+                verify_out={
+                    output_V: 1,
+                    output_P: expected_output,
+                    default_flag: 0,
+                },
+            ), cases)
+
+            # Cases c and d share one setup and differ only in how long the
+            # inputs stay invalid, so they stay spelled out here.
+            cases.advance('normal')
+            write_log(' ---- Setting the Test Condition for Verification case c and d ----', color='green')
+            self.h.set_many({
+                primary_V: 0,
+                validity_oth: 0,
+            })
+            sleep(4)
+
+            write_log(' ---- Verifying the Test Condition for Verification case c ----', color='green')
+            check_signal(aircraft_type, aircraft_expected)
+            self.h.check_many({
+                validity_oth: 0,
+                default_flag: 0,
+                validity_local: 0,
+            })
+
+            write_log(' ---- Verifying the Output Signals for Verification case c ----', color='green')
+            self.h.check_many({
+                output_V: 0,
+                output_P: expected_output,
+            })
+
+            write_log(' ---- Verifying the Test Condition for Verification case d ----', color='green')
+            check_signal(aircraft_type, aircraft_expected)
+            self.h.check_many({
+                validity_oth: 0,
+                default_flag: 0,
+                validity_local: 0,
+            })
+            sleep(2)
+            write_log(' ---- Verifying the Output Signals for Verification case d ----', color='green')
             u.PostProcess('Manually verify output_V, output_P and default_flag when validity_oth and validity_local are False for K_CSS_No_Info_Time seconds in csv record file s3_2_2_1_3_1_2_2__2a')
-            u.CheckSignal(output_V, 0)
-            u.CheckSignal(output_P, initial_value)
-            u.CheckSignal(default_flag, 1)
-
-            next_case('normal')
-            u.WriteToLog(' ---- Setting the Test Condition for Verification case f ----', color='green')
-            u.SetSignal(default_flag_loc, 0)
-            u.SetSignal(validity_oth, 1)
-            u.SetSignal(primary_V, 0)
-            u.SetSignal(parameter_oth, lesstol)
-            u.sleep(4)
-
-            u.WriteToLog(' ---- Verifying the Test Condition for Verification case f ----', color='green')
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(validity_oth, 1)
-            u.CheckSignal(default_flag, 1)
-            u.CheckSignal(validity_local, 0)
-            u.CheckSignal(parameter_oth, lesstol)
-
-            u.WriteToLog(' ---- Verifying the Output Signals for Verification case f ----', color='green')
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, initial_value)
-            u.CheckSignal(default_flag, 1)
-            u.sleep(2)
-            u.PostProcess('Manually verify output_V, output_P and default_flag when validity_oth is True and validity_local is False for K_CSS_No_Info_Time seconds in csv record file s3_2_2_1_3_1_2_2__2a')
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, lesstol)
-            u.CheckSignal(default_flag, 0)
-
-            u.SetSignal(k_css_no_info_time, 3)
-            u.SetSignal(default_flag_loc, 0)
-            u.SetSignal(primary_V, 0)
-            u.SetSignal(validity_oth, 0)
-            u.sleep(4)
-            u.CheckSignal(output_V, 0)
-            u.CheckSignal(output_P, initial_value)
-
-            next_case('robust')
-            u.WriteToLog(' ---- Setting the Test Condition for Verification case g ----', color='green')
-            u.SetSignal(default_flag_loc, 0)
-            u.SetSignal(validity_oth, 1)
-            u.SetSignal(primary_V, 0)
-            u.SetSignal(parameter_oth, lesstol)
-            u.sleep(2)
-
-            u.WriteToLog(' ---- Verifying the Test Condition for Verification case g ----', color='green')
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(k_css_no_info_time, 3)
-            u.CheckSignal(validity_oth, 1)
-            u.CheckSignal(default_flag, 1)
-            u.CheckSignal(validity_local, 0)
-            u.CheckSignal(parameter_oth, lesstol)
-
-            u.WriteToLog(' ---- Verifying the Output Signals for Verification case g ----', color='green')
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, initial_value)
-            u.CheckSignal(default_flag, 1)
-            u.sleep(2)
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, lesstol)
-            u.CheckSignal(default_flag, 0)
-
-            u.SetSignal(k_css_no_info_time, 5)
-            u.sleep(1)
-            u.CheckSignal(k_css_no_info_time, 5)
-
-            next_case('normal')
-            u.WriteToLog(' ---- Setting the Test Condition for Verification case h ----', color='green')
-            u.SetSignal(default_flag_loc, 0)
-            u.SetSignal(primary_V, 1)
-            u.SetSignal(validity_oth, 1)
-            u.SetSignal(parameter_oth, lesstol)
-            u.sleep(1)
-
-            u.WriteToLog(' ---- Verifying the Test Condition for Verification case h ----', color='green')
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(parameter_local, expected_output)
-            u.CheckSignal(default_flag, 0)
-            u.CheckSignal(validity_local, 1)
-            u.CheckSignal(validity_oth, 1)
-            u.CheckSignal(parameter_oth, lesstol)
-
-            u.WriteToLog(' ---- Verifying the Output Signals for Verification case h ----', color='green')
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, expected_output)
-
-            u.SetSignal(default_flag_loc, 0)
-            u.SetSignal(primary_V, 0)
-            u.SetSignal(validity_oth, 0)
-            u.sleep(6)
-            u.CheckSignal(output_V, 0)
-            u.CheckSignal(output_P, initial_value)
-
-            next_case('normal')
-            u.WriteToLog(' ---- Setting the Test Condition for Verification case i ----', color='green')
-            u.SetSignal(default_flag_loc, 0)
-            u.SetSignal(primary_V, 1)
-            u.SetSignal(validity_oth, 1)
-            u.SetSignal(parameter_oth, lesstol)
-            u.sleep(4)
-
-            u.WriteToLog(' ---- Verifying the Test Condition for Verification case i ----', color='green')
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(default_flag, 1)
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, initial_value)
-            u.sleep(2)
-            u.CheckSignal(parameter_local, expected_output)
-            u.CheckSignal(primary_V, 1)
-            u.CheckSignal(ctc_input_data, set_value1)
-            u.CheckSignal(validity_local, 1)
-            u.CheckSignal(validity_oth, 1)
-            u.CheckSignal(parameter_oth, lesstol)
-            u.WriteToLog(' ---- Verifying the Output Signals for Verification case i ----', color='green')
-            u.CheckSignal(output_V, 1)
-            u.CheckSignal(output_P, expected_output)
-            u.CheckSignal(default_flag, 0)
-
-            u.WriteToLog('---- Requirement 2a is complete----', color='green')
-            if opP == 'flight_phase':
-                u.WriteToLog('---- For Parameter Flight_Phase ----', color='orange')
-            elif opP == 'baro_altitude':
-                u.WriteToLog('---- For Parameter Baro_Altitude ----', color='orange')
-            elif opP == 'gnd_speed':
-                u.WriteToLog('---- For Parameter Gnd_Speed ----', color='orange')
-            elif opP == 'equip_cool_sw':
-                u.WriteToLog('---- For Parameter Equip_Cool_Sw ----', color='orange')
-            elif opP == 'gnd_test_data_load_sw':
-                u.WriteToLog('---- For Parameter Gnd_Test_Data_Load_Sw ----', color='orange')
-            elif opP == 'engine_run':
-                u.WriteToLog('---- For Parameter Engine_Run ----', color='orange')
-            else:
-                u.WriteToLog('---- For Parameter Total_Air_Temp ----', color='orange')
-
-        u.SetSignal(k_disable_all_label_aquisition_inputs, 0)
-        u.SetSignal(k_disable_all_can_inputs, 0)
-        u.sleep(1)
-        u.CheckSignal(k_disable_all_label_aquisition_inputs, 0)
-        u.CheckSignal(k_disable_all_can_inputs, 0)
-        return case_no
+            self.h.check_many({
+                output_V: 0,
+                output_P: initial_value,
+                default_flag: 1,
+            })
+
+            self._run_case(VerificationCase(
+                name='f',
+                setup={
+                    default_flag_loc: 0,
+                    validity_oth: 1,
+                    primary_V: 0,
+                    parameter_oth: lesstol,
+                },
+                wait_s=4,
+                verify_cond={
+                    aircraft_type: aircraft_expected,
+                    validity_oth: 1,
+                    default_flag: 1,
+                    validity_local: 0,
+                    parameter_oth: lesstol,
+                },
+                hold_out={
+                    output_V: 1,
+                    output_P: initial_value,
+                    default_flag: 1,
+                },
+                post_process='Manually verify output_V, output_P and default_flag when validity_oth is True and validity_local is False for K_CSS_No_Info_Time seconds in csv record file s3_2_2_1_3_1_2_2__2a',
+                verify_out={
+                    output_V: 1,
+                    output_P: lesstol,
+                    default_flag: 0,
+                },
+            ), cases)
+
+            self.h.set_many({
+                k_css_no_info_time: 3,
+                **reset_state,
+            })
+            sleep(4)
+            self.h.check_many({
+                output_V: 0,
+                output_P: initial_value,
+            })
+
+            self._run_case(VerificationCase(
+                name='g',
+                case_type='robust',
+                setup={
+                    default_flag_loc: 0,
+                    validity_oth: 1,
+                    primary_V: 0,
+                    parameter_oth: lesstol,
+                },
+                wait_s=2,
+                verify_cond={
+                    aircraft_type: aircraft_expected,
+                    k_css_no_info_time: 3,
+                    validity_oth: 1,
+                    default_flag: 1,
+                    validity_local: 0,
+                    parameter_oth: lesstol,
+                },
+                hold_out={
+                    output_V: 1,
+                    output_P: initial_value,
+                    default_flag: 1,
+                },
+                verify_out={
+                    output_V: 1,
+                    output_P: lesstol,
+                    default_flag: 0,
+                },
+            ), cases)
+
+            self.h.set_many({k_css_no_info_time: 5})
+            self.h.wait_for({k_css_no_info_time: 5})
+            check_signal(k_css_no_info_time, 5)
+
+            self._run_case(VerificationCase(
+                name='h',
+                setup={
+                    default_flag_loc: 0,
+                    primary_V: 1,
+                    validity_oth: 1,
+                    parameter_oth: lesstol,
+                },
+                verify_cond={
+                    aircraft_type: aircraft_expected,
+                    parameter_local: expected_output,
+                    default_flag: 0,
+                    validity_local: 1,
+                    validity_oth: 1,
+                    parameter_oth: lesstol,
+                },
+                verify_out={
+                    output_V: 1,
+                    output_P: expected_output,
+                },
+            ), cases)
+
+            self.h.set_many(reset_state)
+            sleep(6)
+            self.h.check_many({
+                output_V: 0,
+                output_P: initial_value,
+            })
+
+            self._run_case(VerificationCase(
+                name='i',
+                setup={
+                    default_flag_loc: 0,
+                    primary_V: 1,
+                    validity_oth: 1,
+                    parameter_oth: lesstol,
+                },
+                wait_s=4,
+                hold_cond={
+                    aircraft_type: aircraft_expected,
+                    default_flag: 1,
+                    output_V: 1,
+                    output_P: initial_value,
+                },
+                verify_cond={
+                    parameter_local: expected_output,
+                    primary_V: 1,
+                    ctc_input_data: set_value1,
+                    validity_local: 1,
+                    validity_oth: 1,
+                    parameter_oth: lesstol,
+                },
+                verify_out={
+                    output_V: 1,
+                    output_P: expected_output,
+                    default_flag: 0,
+                },
+            ), cases)
+
+            write_log('---- Requirement 2a is complete----', color='green')
+            write_log(_OP_LABEL.get(opP, _TOTAL_AIR_TEMP_LABEL), color='orange')
+
+        enable_flags = {
+            k_disable_all_label_aquisition_inputs: 0,
+            k_disable_all_can_inputs: 0,
+        }
+        self.h.set_many(enable_flags)
+        self.h.wait_for(enable_flags)
+        self.h.check_many(enable_flags)
+
+
+    def _run_case(self, case: VerificationCase, cases: CaseCounter) -> None:
+        """Register, set up, and verify one case in the legacy call order."""
+        cases.advance(case.case_type)
+        u.WriteToLog(' ---- Setting the Test Condition for Verification case ' + case.name + ' ----', color='green')
+        self.h.set_many(case.setup)
+        if case.hold_cond is None and case.hold_out is None:
+            self.h.wait_for({**case.verify_cond, **case.verify_out}, timeout=case.wait_s)
+        else:
+            # Timed against K_CSS_No_Info_Time, so never cut short.
+            self.h.settle(case.wait_s)
+        u.WriteToLog(' ---- Verifying the Test Condition for Verification case ' + case.name + ' ----', color='green')
+        if case.hold_cond is not None:
+            self.h.check_many(case.hold_cond)
+            self.h.settle(case.hold_s)
+        self.h.check_many(case.verify_cond)
+        u.WriteToLog(' ---- Verifying the Output Signals for Verification case ' + case.name + ' ----', color='green')
+        if case.hold_out is not None:
+            self.h.check_many(case.hold_out)
+            self.h.settle(case.hold_s)
+        if case.post_process is not None:
+            u.PostProcess(case.post_process)
+        self.h.check_many(case.verify_out)
+
+
+def _test_data_outputs(cs: ChannelSignals, left: int, right: int) -> dict[str, int]:
+    """Expected l/r test-data outputs, in the legacy check order."""
+    return {
+        cs.fd_sw_app_l_test_data: left,
+        cs.fd_sw_app_r_test_data: right,
+        cs.eicas_l_test_data: left,
+        cs.eicas_r_test_data: right,
+        cs.adiru_l_test_data: left,
+        cs.adiru_r_test_data: right,
+        cs.gnd_test_sw_app_l_test_data: left,
+        cs.gnd_test_sw_app_r_test_data: right,
+    }
+
+
+_REQT_2B_UUTS = ('lctc1', 'lctc2', 'rctc1', 'rctc2')
+# lctc2 and rctc1 sit on the crossed side: their l/r outputs are mirrored.
+_REQT_2B_CROSSED = frozenset({'lctc2', 'rctc1'})
+
+# Requirement 2b controller_side / channel_number readback and case letter
+# per UUT.
+_REQT_2B_IDENTITY = {
+    'lctc1': (1, 1, 'a'),
+    'lctc2': (1, 2, 'b'),
+    'rctc1': (2, 1, 'c'),
+    'rctc2': (2, 2, 'd'),
+}
+
+
+@dataclass(frozen=True)
+class Reqt2bPhase:
+    """One Requirement 2b step: drive the primary test data, then verify."""
+
+    stimulus: dict[str, object]
+    condition: dict[str, object]
+    outputs: dict[str, object]
+    condition_banner: str
+
+
+def _reqt_2b_phase(cs: ChannelSignals, test_data: int, outputs: dict[str, int], condition_banner: str) -> Reqt2bPhase:
+    """Primary test data = test_data, the other channel's LSS copy invalid."""
+    invalid = 1 - test_data
+    return Reqt2bPhase(
+        stimulus={
+            cs.fd_sw_app_p_test_data: test_data,
+            cs.eicas_p_test_data: test_data,
+            cs.adiru_p_test_data: test_data,
+            cs.gnd_test_sw_app_p_test_data: test_data,
+            cs.fd_sw_app_lss_test_data_oc: invalid,
+            cs.eicas_lss_test_data_oc: invalid,
+            cs.adiru_lss_test_data_oc: invalid,
+            cs.gnd_test_sw_app_lss_test_data_oc: invalid,
+        },
+        condition={
+            cs.fd_sw_app_lss_test_data: test_data,
+            cs.fd_sw_app_lss_test_data_oc: invalid,
+            cs.eicas_lss_test_data: test_data,
+            cs.eicas_lss_test_data_oc: invalid,
+            cs.adiru_lss_test_data: test_data,
+            cs.adiru_lss_test_data_oc: invalid,
+            cs.gnd_test_sw_app_lss_test_data: test_data,
+            cs.gnd_test_sw_app_lss_test_data_oc: invalid,
+        },
+        outputs=outputs,
+        condition_banner=condition_banner,
+    )
+
+
+def _reqt_2b_phases(uut_base: str) -> tuple[Reqt2bPhase, Reqt2bPhase]:
+    """Set, then clear, the primary test data for one UUT."""
+    cs = _channel_signals(uut_base)
+    left, right = _test_data_outputs(cs, 1, 0), _test_data_outputs(cs, 0, 1)
+    if uut_base in _REQT_2B_CROSSED:
+        # The legacy clear banner for the crossed channels says "Conditions".
+        return (
+            _reqt_2b_phase(cs, 1, right, '--Verify the Test Condition for Verification Case '),
+            _reqt_2b_phase(cs, 0, left, '--Verify the Test Conditions for Verification Case '),
+        )
+    return (
+        _reqt_2b_phase(cs, 1, left, '--Verify the Test Condition for Verification Case '),
+        _reqt_2b_phase(cs, 0, right, '--Verify the Test Condition for Verification Case '),
+    )
+
+
+_REQT_2B_PHASES = {uut_base: _reqt_2b_phases(uut_base) for uut_base in _REQT_2B_UUTS}
 
 
 class Requirement2B:
@@ -560,347 +847,78 @@ class Requirement2B:
         self.h = ctx.h
 
     def run(self) -> None:
-        UUT_list = ['lctc1', 'lctc2', 'rctc1', 'rctc2']
         aircraft_type_list = ['passenger', 'freighter']
-        testpoint = 2
-        testcase = 0
+        cases = CaseCounter(testpoint=2)
 
-        if self.ctx.config.record_data:
-            u.StartRecording(self.ctx.config.rec_id_2b, screen_name=self.ctx.config.rec_id_2b, rec_freq_hz=self.ctx.config.rec_freq_hz)
+        with self.ctx.recording(self.ctx.config.rec_id_2b):
+            for aircraft_type_signal in aircraft_type_list:
+                for uut_base in _REQT_2B_UUTS:
+                    self._run_for_channel(uut_base, aircraft_type_signal, cases)
 
-        for aircraft_type_signal in aircraft_type_list:
-            for uut_base in UUT_list:
-                testcase = self._run_for_channel(uut_base, aircraft_type_signal, testpoint, testcase)
+        u.WriteToLog('--- The 2b requirement is complete---', color='orange')
 
-        if self.ctx.config.record_data:
-            u.StopRecording()
+    def _run_for_channel(self, uut_base: str, aircraft_type_signal: str, cases: CaseCounter) -> None:
+        u.WriteToLog('#-- Req 2b Test start for channel: ' + uut_base + ' for ' + aircraft_type_signal + '--#', color='green')
 
-        u.WriteToLog('--- The 2b requirement is complete---', color='orange')
+        cs = _channel_signals(uut_base)
+        set_phase, clear_phase = _REQT_2B_PHASES[uut_base]
+        k_disable_all_label_aquisition_inputs = cs.k_disable_all_label_aquisition_inputs
+        k_disable_all_can_inputs = cs.k_disable_all_can_inputs
+        aircraft_type = cs.aircraft_type
+
+        # Loop-invariant for the whole channel run: the expected identity
+        # readback and the case letter used in the banners.
+        aircraft_expected = 8 if aircraft_type_signal == 'freighter' else 7
+        side, channel, case = _REQT_2B_IDENTITY[uut_base]
+        identity = {
+            cs.controller_side: side,
+            cs.channel_number: channel,
+            aircraft_type: aircraft_expected,
+        }
+
+        self.h.set_many({aircraft_type: aircraft_expected})
+        self.h.wait_for({aircraft_type: aircraft_expected})
+        u.CheckSignal(aircraft_type, aircraft_expected)
 
-    def _run_for_channel(self, uut_base: str, aircraft_type_signal: str, testpoint: int, testcase: int) -> int:
-        uut = f"{uut_base}::"
-        # Shared signal-name helper for this channel.
-        def s(name: str) -> str:
-            return f"{uut}{name}"
+        u.WriteToLog('--- Setting Disable Flags ----')
+        disable_flags = {
+            k_disable_all_label_aquisition_inputs: 1,
+            k_disable_all_can_inputs: 1,
+        }
+        self.h.set_many(disable_flags)
+        self.h.wait_for(disable_flags)
+        self.h.check_many(disable_flags)
+
+        # Start from the cleared state so the first phase's outputs change.
+        u.WriteToLog('---- Check outputs are set to different value before checking their initial Test case value ----', color='green')
+        self.h.set_many(clear_phase.stimulus)
+        self.h.wait_for(clear_phase.outputs)
 
-        case_no = testcase
+        self.h.check_many(clear_phase.outputs)
 
-        def next_case(case_type: str = 'normal') -> int:
-            """Increment and register the next testcase number with the harness."""
-            nonlocal case_no
-            case_no += 1
-            u.SetTestCase(testpoint, case_no, type=case_type)
-            return case_no
-        u.WriteToLog('#-- Req 2b Test start for channel: ' + uut_base + ' for ' + aircraft_type_signal + '--#', color='green')
+        cases.advance('normal')
 
-        controller_side = s('controller_side')
-        channel_number = s('channel_number')
-        fd_sw_app_l_test_data = s('fd_sw_app_l_test_data')
-        fd_sw_app_r_test_data = s('fd_sw_app_r_test_data')
-        eicas_l_test_data = s('eicas_l_test_data')
-        eicas_r_test_data = s('eicas_r_test_data')
-        adiru_l_test_data = s('adiru_l_test_data')
-        adiru_r_test_data = s('adiru_r_test_data')
-        gnd_test_sw_app_l_test_data = s('gnd_test_sw_app_l_test_data')
-        gnd_test_sw_app_r_test_data = s('gnd_test_sw_app_r_test_data')
-        fd_sw_app_lss_test_data = s('fd_sw_app_lss_test_data')
-        fd_sw_app_lss_test_data_oc = s('fd_sw_app_lss_test_data_oc')
-        eicas_lss_test_data = s('eicas_lss_test_data')
-        eicas_lss_test_data_oc = s('eicas_lss_test_data_oc')
-        adiru_lss_test_data = s('adiru_lss_test_data')
-        adiru_lss_test_data_oc = s('adiru_lss_test_data_oc')
-        gnd_test_sw_app_lss_test_data = s('gnd_test_sw_app_lss_test_data')
-        gnd_test_sw_app_lss_test_data_oc = s('gnd_test_sw_app_lss_test_data_oc')
-        fd_sw_app_p_test_data = s('fd_sw_app_p_test_data')
-        eicas_p_test_data = s('eicas_p_test_data')
-        adiru_p_test_data = s('adiru_p_test_data')
-        gnd_test_sw_app_p_test_data = s('gnd_test_sw_app_p_test_data')
-        adiru_r_test_data = s('adiru_r_test_data')
-        k_disable_all_label_aquisition_inputs = s('k_disable_all_label_aquisition_inputs')
-        k_disable_all_can_inputs = s('k_disable_all_can_inputs')
-        aircraft_type = s('aircraft_type')
-
-        if aircraft_type_signal == 'freighter':
-            u.SetSignal(aircraft_type, 8)
-            u.sleep(1)
-            u.CheckSignal(aircraft_type, 8)
-        else:
-            u.SetSignal(aircraft_type, 7)
-            u.sleep(1)
-            u.CheckSignal(aircraft_type, 7)
+        for phase in (set_phase, clear_phase):
+            u.WriteToLog('--Set the Test Condition for Verification Case ' + case, color='orange')
+            self.h.set_many(phase.stimulus)
+            self.h.wait_for({**identity, **phase.condition, **phase.outputs})
 
-        u.WriteToLog('--- Setting Disable Flags ----')
-        u.SetSignal(k_disable_all_label_aquisition_inputs, 1)
-        u.SetSignal(k_disable_all_can_inputs, 1)
-        u.sleep(1)
-        u.CheckSignal(k_disable_all_label_aquisition_inputs, 1)
-        u.CheckSignal(k_disable_all_can_inputs, 1)
+            u.WriteToLog(phase.condition_banner + case, color='orange')
+            self.h.check_many(identity)
+            self.h.check_many(phase.condition)
 
-        u.WriteToLog('---- Check outputs are set to different value before checking their initial Test case value ----', color='green')
-        u.SetSignal(fd_sw_app_p_test_data, 0)
-        u.SetSignal(eicas_p_test_data, 0)
-        u.SetSignal(adiru_p_test_data, 0)
-        u.SetSignal(gnd_test_sw_app_p_test_data, 0)
-        u.SetSignal(fd_sw_app_lss_test_data_oc, 1)
-        u.SetSignal(eicas_lss_test_data_oc, 1)
-        u.SetSignal(adiru_lss_test_data_oc, 1)
-        u.SetSignal(gnd_test_sw_app_lss_test_data_oc, 1)
-        u.sleep(1)
-
-        if uut == 'lctc1::' or uut == 'rctc2::':
-            u.CheckSignal(fd_sw_app_l_test_data, 0)
-            u.CheckSignal(fd_sw_app_r_test_data, 1)
-            u.CheckSignal(eicas_l_test_data, 0)
-            u.CheckSignal(eicas_r_test_data, 1)
-            u.CheckSignal(adiru_l_test_data, 0)
-            u.CheckSignal(adiru_r_test_data, 1)
-            u.CheckSignal(gnd_test_sw_app_l_test_data, 0)
-            u.CheckSignal(gnd_test_sw_app_r_test_data, 1)
-        else:
-            u.CheckSignal(fd_sw_app_l_test_data, 1)
-            u.CheckSignal(fd_sw_app_r_test_data, 0)
-            u.CheckSignal(eicas_l_test_data, 1)
-            u.CheckSignal(eicas_r_test_data, 0)
-            u.CheckSignal(adiru_l_test_data, 1)
-            u.CheckSignal(adiru_r_test_data, 0)
-            u.CheckSignal(gnd_test_sw_app_l_test_data, 1)
-            u.CheckSignal(gnd_test_sw_app_r_test_data, 0)
-
-        next_case('normal')
-
-        if uut == 'lctc1::' or uut == 'rctc2::':
-            if uut == 'lctc1::':
-                u.WriteToLog('--Set the Test Condition for Verification Case a', color='orange')
-            else:
-                u.WriteToLog('--Set the Test Condition for Verification Case d', color='orange')
-            u.SetSignal(fd_sw_app_p_test_data, 1)
-            u.SetSignal(eicas_p_test_data, 1)
-            u.SetSignal(adiru_p_test_data, 1)
-            u.SetSignal(gnd_test_sw_app_p_test_data, 1)
-            u.SetSignal(fd_sw_app_lss_test_data_oc, 0)
-            u.SetSignal(eicas_lss_test_data_oc, 0)
-            u.SetSignal(adiru_lss_test_data_oc, 0)
-            u.SetSignal(gnd_test_sw_app_lss_test_data_oc, 0)
-            u.sleep(1)
-
-            if uut == 'rctc2::':
-                u.WriteToLog('--Verify the Test Condition for Verification Case d', color='orange')
-                u.CheckSignal(controller_side, 2)
-                u.CheckSignal(channel_number, 2)
-            else:
-                u.WriteToLog('--Verify the Test Condition for Verification Case a', color='orange')
-                u.CheckSignal(controller_side, 1)
-                u.CheckSignal(channel_number, 1)
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(fd_sw_app_lss_test_data, 1)
-            u.CheckSignal(fd_sw_app_lss_test_data_oc, 0)
-            u.CheckSignal(eicas_lss_test_data, 1)
-            u.CheckSignal(eicas_lss_test_data_oc, 0)
-            u.CheckSignal(adiru_lss_test_data, 1)
-            u.CheckSignal(adiru_lss_test_data_oc, 0)
-            u.CheckSignal(gnd_test_sw_app_lss_test_data, 1)
-            u.CheckSignal(gnd_test_sw_app_lss_test_data_oc, 0)
-
-            if uut == 'rctc2::':
-                u.WriteToLog('--Verify the Test Outputs for Verification Case d', color='orange')
-                u.CheckSignal(controller_side, 2)
-                u.CheckSignal(channel_number, 2)
-            else:
-                u.WriteToLog('--Verify the Test Outputs for Verification Case a', color='orange')
-                u.CheckSignal(controller_side, 1)
-                u.CheckSignal(channel_number, 1)
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(fd_sw_app_l_test_data, 1)
-            u.CheckSignal(fd_sw_app_r_test_data, 0)
-            u.CheckSignal(eicas_l_test_data, 1)
-            u.CheckSignal(eicas_r_test_data, 0)
-            u.CheckSignal(adiru_l_test_data, 1)
-            u.CheckSignal(adiru_r_test_data, 0)
-            u.CheckSignal(gnd_test_sw_app_l_test_data, 1)
-            u.CheckSignal(gnd_test_sw_app_r_test_data, 0)
-
-            if uut == 'lctc1::':
-                u.WriteToLog('--Set the Test Condition for Verification Case a', color='orange')
-            else:
-                u.WriteToLog('--Set the Test Condition for Verification Case d', color='orange')
-            u.SetSignal(fd_sw_app_p_test_data, 0)
-            u.SetSignal(eicas_p_test_data, 0)
-            u.SetSignal(adiru_p_test_data, 0)
-            u.SetSignal(gnd_test_sw_app_p_test_data, 0)
-            u.SetSignal(fd_sw_app_lss_test_data_oc, 1)
-            u.SetSignal(eicas_lss_test_data_oc, 1)
-            u.SetSignal(adiru_lss_test_data_oc, 1)
-            u.SetSignal(gnd_test_sw_app_lss_test_data_oc, 1)
-            u.sleep(1)
-
-            if uut == 'rctc2::':
-                u.WriteToLog('--Verify the Test Condition for Verification Case d', color='orange')
-                u.CheckSignal(controller_side, 2)
-                u.CheckSignal(channel_number, 2)
-            else:
-                u.WriteToLog('--Verify the Test Condition for Verification Case a', color='orange')
-                u.CheckSignal(controller_side, 1)
-                u.CheckSignal(channel_number, 1)
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(fd_sw_app_lss_test_data, 0)
-            u.CheckSignal(fd_sw_app_lss_test_data_oc, 1)
-            u.CheckSignal(eicas_lss_test_data, 0)
-            u.CheckSignal(eicas_lss_test_data_oc, 1)
-            u.CheckSignal(adiru_lss_test_data, 0)
-            u.CheckSignal(adiru_lss_test_data_oc, 1)
-            u.CheckSignal(gnd_test_sw_app_lss_test_data, 0)
-            u.CheckSignal(gnd_test_sw_app_lss_test_data_oc, 1)
-
-            if uut == 'rctc2::':
-                u.WriteToLog('--Verify the Test Outputs for Verification Case d', color='orange')
-                u.CheckSignal(controller_side, 2)
-                u.CheckSignal(channel_number, 2)
-            else:
-                u.WriteToLog('--Verify the Test Outputs for Verification Case a', color='orange')
-                u.CheckSignal(controller_side, 1)
-                u.CheckSignal(channel_number, 1)
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(fd_sw_app_l_test_data, 0)
-            u.CheckSignal(fd_sw_app_r_test_data, 1)
-            u.CheckSignal(eicas_l_test_data, 0)
-            u.CheckSignal(eicas_r_test_data, 1)
-            u.CheckSignal(adiru_l_test_data, 0)
-            u.CheckSignal(adiru_r_test_data, 1)
-            u.CheckSignal(gnd_test_sw_app_l_test_data, 0)
-            u.CheckSignal(gnd_test_sw_app_r_test_data, 1)
-
-        elif uut == 'lctc2::' or uut == 'rctc1::':
-            if uut == 'lctc2::':
-                u.WriteToLog('--Set the Test Condition for Verification Case b', color='orange')
-            else:
-                u.WriteToLog('--Set the Test Condition for Verification Case c', color='orange')
-            u.SetSignal(fd_sw_app_p_test_data, 1)
-            u.SetSignal(eicas_p_test_data, 1)
-            u.SetSignal(adiru_p_test_data, 1)
-            u.SetSignal(gnd_test_sw_app_p_test_data, 1)
-            u.SetSignal(fd_sw_app_lss_test_data_oc, 0)
-            u.SetSignal(eicas_lss_test_data_oc, 0)
-            u.SetSignal(adiru_lss_test_data_oc, 0)
-            u.SetSignal(gnd_test_sw_app_lss_test_data_oc, 0)
-            u.sleep(1)
-
-            if uut == 'rctc1::':
-                u.WriteToLog('--Verify the Test Condition for Verification Case c', color='orange')
-                u.CheckSignal(controller_side, 2)
-                u.CheckSignal(channel_number, 1)
-            else:
-                u.WriteToLog('--Verify the Test Condition for Verification Case b', color='orange')
-                u.CheckSignal(controller_side, 1)
-                u.CheckSignal(channel_number, 2)
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(fd_sw_app_lss_test_data, 1)
-            u.CheckSignal(fd_sw_app_lss_test_data_oc, 0)
-            u.CheckSignal(eicas_lss_test_data, 1)
-            u.CheckSignal(eicas_lss_test_data_oc, 0)
-            u.CheckSignal(adiru_lss_test_data, 1)
-            u.CheckSignal(adiru_lss_test_data_oc, 0)
-            u.CheckSignal(gnd_test_sw_app_lss_test_data, 1)
-            u.CheckSignal(gnd_test_sw_app_lss_test_data_oc, 0)
-
-            if uut == 'rctc1::':
-                u.WriteToLog('--Verify the Test Outputs for Verification Case c', color='orange')
-                u.CheckSignal(controller_side, 2)
-                u.CheckSignal(channel_number, 1)
-            else:
-                u.WriteToLog('--Verify the Test Outputs for Verification Case b', color='orange')
-                u.CheckSignal(controller_side, 1)
-                u.CheckSignal(channel_number, 2)
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(fd_sw_app_l_test_data, 0)
-            u.CheckSignal(fd_sw_app_r_test_data, 1)
-            u.CheckSignal(eicas_l_test_data, 0)
-            u.CheckSignal(eicas_r_test_data, 1)
-            u.CheckSignal(adiru_l_test_data, 0)
-            u.CheckSignal(adiru_r_test_data, 1)
-            u.CheckSignal(gnd_test_sw_app_l_test_data, 0)
-            u.CheckSignal(gnd_test_sw_app_r_test_data, 1)
-
-            if uut == 'lctc2::':
-                u.WriteToLog('--Set the Test Condition for Verification Case b', color='orange')
-            else:
-                u.WriteToLog('--Set the Test Condition for Verification Case c', color='orange')
-            u.SetSignal(fd_sw_app_p_test_data, 0)
-            u.SetSignal(eicas_p_test_data, 0)
-            u.SetSignal(adiru_p_test_data, 0)
-            u.SetSignal(gnd_test_sw_app_p_test_data, 0)
-            u.SetSignal(fd_sw_app_lss_test_data_oc, 1)
-            u.SetSignal(eicas_lss_test_data_oc, 1)
-            u.SetSignal(adiru_lss_test_data_oc, 1)
-            u.SetSignal(gnd_test_sw_app_lss_test_data_oc, 1)
-            u.sleep(1)
-
-            if uut == 'rctc1::':
-                u.WriteToLog('--Verify the Test Conditions for Verification Case c', color='orange')
-                u.CheckSignal(controller_side, 2)
-                u.CheckSignal(channel_number, 1)
-            else:
-                u.WriteToLog('--Verify the Test Conditions for Verification Case b', color='orange')
-                u.CheckSignal(controller_side, 1)
-                u.CheckSignal(channel_number, 2)
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(fd_sw_app_lss_test_data, 0)
-            u.CheckSignal(fd_sw_app_lss_test_data_oc, 1)
-            u.CheckSignal(eicas_lss_test_data, 0)
-            u.CheckSignal(eicas_lss_test_data_oc, 1)
-            u.CheckSignal(adiru_lss_test_data, 0)
-            u.CheckSignal(adiru_lss_test_data_oc, 1)
-            u.CheckSignal(gnd_test_sw_app_lss_test_data, 0)
-            u.CheckSignal(gnd_test_sw_app_lss_test_data_oc, 1)
-
-            if uut == 'rctc1::':
-                u.WriteToLog('--Verify the Test Outputs for Verification Case c', color='orange')
-                u.CheckSignal(controller_side, 2)
-                u.CheckSignal(channel_number, 1)
-            else:
-                u.WriteToLog('--Verify the Test Outputs for Verification Case b', color='orange')
-                u.CheckSignal(controller_side, 1)
-                u.CheckSignal(channel_number, 2)
-            if aircraft_type_signal == 'freighter':
-                u.CheckSignal(aircraft_type, 8)
-            else:
-                u.CheckSignal(aircraft_type, 7)
-            u.CheckSignal(fd_sw_app_l_test_data, 1)
-            u.CheckSignal(fd_sw_app_r_test_data, 0)
-            u.CheckSignal(eicas_l_test_data, 1)
-            u.CheckSignal(eicas_r_test_data, 0)
-            u.CheckSignal(adiru_l_test_data, 1)
-            u.CheckSignal(adiru_r_test_data, 0)
-            u.CheckSignal(gnd_test_sw_app_l_test_data, 1)
-            u.CheckSignal(gnd_test_sw_app_r_test_data, 0)
+            u.WriteToLog('--Verify the Test Outputs for Verification Case ' + case, color='orange')
+            self.h.check_many(identity)
+            self.h.check_many(phase.outputs)
 
         u.WriteToLog('--- Clearing Disable Flags ----')
-        u.SetSignal(k_disable_all_label_aquisition_inputs, 0)
-        u.SetSignal(k_disable_all_can_inputs, 0)
-        u.sleep(1)
-        u.CheckSignal(k_disable_all_label_aquisition_inputs, 0)
-        u.CheckSignal(k_disable_all_can_inputs, 0)
-        return case_no
+        enable_flags = {
+            k_disable_all_label_aquisition_inputs: 0,
+            k_disable_all_can_inputs: 0,
+        }
+        self.h.set_many(enable_flags)
+        self.h.wait_for(enable_flags)
+        self.h.check_many(enable_flags)
 
 
 class ScriptRunner:
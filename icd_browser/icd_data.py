@@ -10,10 +10,12 @@ You can override column names via a JSON config instead of editing code.
 
 from __future__ import annotations
 
+import hashlib
 import sys
+from functools import lru_cache, singledispatch
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Tuple, List
+from typing import Any, Dict, Iterable, Mapping, Tuple, List, TypeVar
 import json
 
 import polars as pl
@@ -26,6 +28,7 @@ if str(ROOT) not in sys.path:
 from icd_common.normalize import (
     NormalizationReport,
     apply_fill_down as shared_apply_fill_down,
+    table_select_exprs,
     normalize_icd_tables,
     resolve_fill_down_raw,
 )
@@ -48,28 +51,91 @@ try:
 except ImportError:  # Streamlit is required for the app but keep imports lazy for library usage.
     st = None
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON parser; the stdlib json module is the fallback.
+    orjson = None
+
+
+
+# Bytes hashed from each end of an upload for its cache fingerprint.
+_FINGERPRINT_SPAN = 64 * 1024
+
+
+def _bytes_fingerprint(data: bytes | bytearray | memoryview) -> tuple[int, str, str]:
+    """
+    Cheap content fingerprint: length plus digests of the first and last 64 KiB.
+
+    An .xlsx is a zip archive whose central directory (with a CRC per member)
+    sits at the end of the file, so edits anywhere in a workbook change the tail.
+    """
+
+    view = memoryview(data)
+    head = hashlib.blake2b(view[:_FINGERPRINT_SPAN], digest_size=16).hexdigest()
+    tail = hashlib.blake2b(view[-_FINGERPRINT_SPAN:], digest_size=16).hexdigest()
+    return len(view), head, tail
+
+
+def _buffer_fingerprint(buffer: BytesIO) -> tuple[int, str, str]:
+    return _bytes_fingerprint(buffer.getbuffer())
+
+
+# Uploads (Streamlit's UploadedFile is a BytesIO subclass) are fingerprinted by
+# content, so a rerun with the same file hits the cache without a full hash.
+_UPLOAD_HASH_FUNCS = {
+    bytes: _bytes_fingerprint,
+    bytearray: _bytes_fingerprint,
+    BytesIO: _buffer_fingerprint,
+    "streamlit.runtime.uploaded_file_manager.UploadedFile": _buffer_fingerprint,
+}
+
+
+def _cache_data(func=None, *, hash_funcs: Mapping[Any, Any] | None = None):
+    """
+    Wrap a function in st.cache_data when Streamlit is available.
 
+    Usable bare (@_cache_data) or with extra per-function hash_funcs.
+    """
 
-def _cache_data(func):
-    """Wrap a function in st.cache_data when Streamlit is available."""
+    if func is None:
+        return lambda f: _cache_data(f, hash_funcs=hash_funcs)
 
     if st is None:
         return func
 
     # Streamlit's default hashing for Polars calls hash_rows, which panics on empty frames.
-    hash_funcs = {pl.DataFrame: lambda df: (tuple(df.columns), df.shape)}
-    return st.cache_data(show_spinner=False, hash_funcs=hash_funcs)(func)
+    merged_hash_funcs = {pl.DataFrame: lambda df: (tuple(df.columns), df.shape, df.estimated_size())}
+    merged_hash_funcs.update(hash_funcs or {})
+    return st.cache_data(show_spinner=False, hash_funcs=merged_hash_funcs)(func)
+
+
+# The build_*_df helpers accept either frame kind and return the same kind, so
+# LazyFrame inputs stay lazy until the caller collects them.
+Frame = TypeVar("Frame", pl.DataFrame, pl.LazyFrame)
 
 
-def _ensure_columns(df: pl.DataFrame, required: Iterable[str], context: str) -> None:
+def _ensure_columns(df: pl.DataFrame | pl.LazyFrame, required: Iterable[str], context: str) -> None:
     """Raise a clear error if any required columns are missing."""
 
-    missing = [col for col in required if col not in df.columns]
+    columns = set(df.collect_schema().names())
+    missing = [col for col in required if col not in columns]
     if missing:
         missing_str = ", ".join(missing)
         raise ValueError(f"Missing required columns for {context}: {missing_str}")
 
 
+def _parse_json(content: str) -> Any:
+    """
+    Parse JSON text with orjson when installed, else the stdlib parser.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+    """
+
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 def _extract_mapping_and_fill_down(preset_obj: Any, *, context: str) -> Tuple[Dict[str, Dict[str, str]], List[str]]:
     """
     Support two shapes:
@@ -113,7 +179,7 @@ def _load_mapping_presets_from_json(content: str) -> tuple[Dict[str, Dict[str, A
     """
 
     try:
-        data = json.loads(content)
+        data = _parse_json(content)
     except json.JSONDecodeError as exc:
         raise ValueError(f"Invalid JSON in mapping config: {exc}") from exc
 
@@ -156,13 +222,35 @@ def _load_mapping_json(content: str) -> Dict[str, Dict[str, str]]:
     """Parse JSON mapping content into the expected structure."""
 
     try:
-        data = json.loads(content)
+        data = _parse_json(content)
     except json.JSONDecodeError as exc:
         raise ValueError(f"Invalid JSON in mapping config: {exc}") from exc
 
     return _normalize_mapping_object(data)
 
 
+@lru_cache(maxsize=32)
+def _merged_presets_from_json(content: str) -> tuple[Dict[str, Dict[str, Any]], str]:
+    """
+    Parse, validate and merge a mapping config once per distinct JSON text.
+
+    Callers outside Streamlit (and load_column_mappings switching presets) reuse
+    the result instead of re-parsing the same file.
+    """
+
+    presets_raw, default_name = _load_mapping_presets_from_json(content)
+    merged_presets: Dict[str, Dict[str, Any]] = {}
+    for name, payload in presets_raw.items():
+        mapping = merge_column_mappings(payload["mapping"], base=DEFAULT_COLUMN_MAPS)
+        fill_raw, _ = resolve_fill_down_raw(
+            mapping,
+            payload.get("fill_down", DEFAULT_FILL_DOWN_CANONICAL),
+            include_defaults=True,
+        )
+        merged_presets[name] = {"mapping": mapping, "fill_down": fill_raw}
+    return merged_presets, default_name
+
+
 @_cache_data
 def load_mapping_presets(config_path_or_bytes: Any | None = None) -> tuple[Dict[str, Dict[str, Any]], str]:
     """
@@ -187,17 +275,15 @@ def load_mapping_presets(config_path_or_bytes: Any | None = None) -> tuple[Dict[
     else:
         content = config_path_or_bytes.read().decode("utf-8")
 
-    presets_raw, default_name = _load_mapping_presets_from_json(content)
-    merged_presets: Dict[str, Dict[str, Any]] = {}
-    for name, payload in presets_raw.items():
-        mapping = merge_column_mappings(payload["mapping"], base=DEFAULT_COLUMN_MAPS)
-        fill_raw, _ = resolve_fill_down_raw(
-            mapping,
-            payload.get("fill_down", DEFAULT_FILL_DOWN_CANONICAL),
-            include_defaults=True,
-        )
-        merged_presets[name] = {"mapping": mapping, "fill_down": fill_raw}
-    return merged_presets, default_name
+    merged_presets, default_name = _merged_presets_from_json(content)
+    # The parsed presets are shared by the lru_cache; hand each caller its own dicts.
+    return {
+        name: {
+            "mapping": {table: dict(cols) for table, cols in payload["mapping"].items()},
+            "fill_down": list(payload["fill_down"]),
+        }
+        for name, payload in merged_presets.items()
+    }, default_name
 
 
 @_cache_data
@@ -224,21 +310,93 @@ def load_column_mappings(config_path_or_bytes: Any | None = None, preset: str |
     return presets[chosen]["mapping"]
 
 
+@singledispatch
 def _excel_source(path_or_bytes: Any) -> Any:
     """
     Return a rewindable Excel source for pandas/polars.
 
     Bytes/BytesIO inputs are rewound to position 0 so multiple readers can consume them.
+    Overloads are registered per input type below; this default handles wrappers
+    exposing getvalue() and passes anything else through.
     """
 
-    if isinstance(path_or_bytes, BytesIO):
-        path_or_bytes.seek(0)
+    getvalue = getattr(path_or_bytes, "getvalue", None)
+    if getvalue is None:
+        return path_or_bytes
+    try:
+        return BytesIO(getvalue())
+    except Exception:
+        # Fall back to original object; downstream readers may still handle it.
         return path_or_bytes
-    if isinstance(path_or_bytes, (bytes, bytearray)):
-        return BytesIO(path_or_bytes)
+
+
+@_excel_source.register(BytesIO)
+def _(path_or_bytes: BytesIO) -> BytesIO:
+    # Streamlit's UploadedFile is a BytesIO subclass and lands here too.
+    path_or_bytes.seek(0)
     return path_or_bytes
 
 
+@_excel_source.register(bytes)
+@_excel_source.register(bytearray)
+def _(path_or_bytes: bytes | bytearray) -> BytesIO:
+    return BytesIO(path_or_bytes)
+
+
+@_excel_source.register(str)
+@_excel_source.register(Path)
+def _(path_or_bytes: str | Path) -> Path:
+    return Path(path_or_bytes)
+
+
+def _read_first_nonempty_sheet_with_calamine(path_or_bytes: Any):
+    """
+    Return the first non-empty sheet as a Polars frame and its sheet name, via fastexcel.
+
+    fastexcel (the calamine reader behind polars' default Excel engine) reports
+    each sheet's height once it is loaded, so empty sheets are skipped without
+    the pandas round-trip. Raises ImportError when fastexcel is not installed.
+    """
+
+    import fastexcel
+
+    source = path_or_bytes
+    if isinstance(source, BytesIO):
+        source = source.getvalue()
+    elif isinstance(source, bytearray):
+        source = bytes(source)
+
+    reader = fastexcel.read_excel(source)
+    sheet_shapes = []
+    for sheet_name in reader.sheet_names:
+        sheet = reader.load_sheet(sheet_name)
+        sheet_shapes.append((sheet_name, (sheet.height, sheet.width)))
+        if sheet.height:
+            return sheet.to_polars(), sheet_name
+
+    raise ValueError(
+        f"Excel workbook contains no data rows; sheets inspected: {sheet_shapes or '[]'}"
+    )
+
+
+def _read_first_nonempty_sheet_with_openpyxl(path_or_bytes: Any):
+    """
+    Read all sheets through polars' openpyxl engine; return the first non-empty one and its name.
+
+    Used when fastexcel is unavailable; it still skips the pandas -> Polars copy.
+    """
+
+    sheets = pl.read_excel(_excel_source(path_or_bytes), engine="openpyxl", sheet_id=0, raise_if_empty=False)
+    for sheet_name, sheet_df in sheets.items():
+        if not sheet_df.is_empty():
+            return sheet_df, sheet_name
+
+    sheet_shapes = [(sheet_name, sheet_df.shape) for sheet_name, sheet_df in sheets.items()]
+    raise ValueError(
+        f"Excel workbook contains no data rows; sheets inspected: {sheet_shapes or '[]'}"
+    )
+
+
 def _read_first_nonempty_sheet_with_pandas(path_or_bytes: Any):
     """Read all sheets with pandas and return the first non-empty frame and its sheet name."""
 
@@ -268,41 +426,95 @@ def apply_fill_down(df: pl.DataFrame, columns: Iterable[str]) -> pl.DataFrame:
     return shared_apply_fill_down(df, columns)
 
 
-@_cache_data
-def load_excel_to_polars(path_or_bytes: Any) -> pl.DataFrame:
+@_cache_data(hash_funcs=_UPLOAD_HASH_FUNCS)
+def load_excel_to_polars(path_or_bytes: Any, *, cache_dir: str | Path | None = None) -> pl.DataFrame:
     """
     Load a flat Excel export into a Polars DataFrame.
 
-    Uses polars.read_excel when available, otherwise falls back to pandas.read_excel
-    with a conversion to Polars. The function is cached for performance in Streamlit.
+    Uses polars.read_excel with the calamine engine when available. If the first
+    sheet is empty (or Polars cannot read it), the workbook is probed sheet by
+    sheet with fastexcel, then read through polars' openpyxl engine, and only
+    then falls back to pandas.read_excel with a conversion to Polars. The
+    function is cached for performance in Streamlit.
+
+    When cache_dir is given, the parsed frame is also kept there as an Arrow IPC
+    file named by the workbook's content hash, so a restart (or another process)
+    memory-maps it instead of parsing the workbook again.
     """
 
-    source_label = "in-memory bytes"
     if isinstance(path_or_bytes, (str, Path)):
         source_label = str(path_or_bytes)
-        path_or_bytes = Path(path_or_bytes)
+    else:
+        source_label = getattr(path_or_bytes, "name", None) or "in-memory bytes"
+
+    # Wrap bytes in one BytesIO up front; each reader below only rewinds it via
+    # _excel_source, so a large upload is not copied again per attempt.
+    source = _excel_source(path_or_bytes)
 
-    # Streamlit's UploadedFile and similar wrappers expose getvalue(); coerce to bytes early.
-    if hasattr(path_or_bytes, "getvalue") and not isinstance(
-        path_or_bytes, (bytes, bytearray, BytesIO)
-    ):
+    if cache_dir is None:
+        return _read_excel_source(source, source_label)
+
+    cache_path = _disk_cache_path(Path(cache_dir), source)
+    if cache_path is not None and cache_path.exists():
+        return pl.read_ipc(cache_path)
+
+    df = _read_excel_source(source, source_label)
+    if cache_path is not None:
         try:
-            source_label = getattr(path_or_bytes, "name", source_label)
-            path_or_bytes = path_or_bytes.getvalue()
-        except Exception:
-            # Fall back to original object; downstream readers may still handle it.
-            pass
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write beside the target and rename, so readers never see a partial file.
+            partial_path = cache_path.with_suffix(".partial")
+            # Uncompressed, so Polars can memory-map the file instead of decoding it.
+            df.write_ipc(partial_path, compression="uncompressed")
+            partial_path.replace(cache_path)
+        except OSError as exc:  # pragma: no cover - cache is best-effort
+            print(f"Could not write Excel cache {cache_path}: {exc}")
+    return df
+
+
+def _disk_cache_path(cache_dir: Path, source: Any) -> Path | None:
+    """Arrow IPC cache file for an Excel source, keyed by a hash of its full contents."""
+
+    if isinstance(source, BytesIO):
+        with source.getbuffer() as view:
+            digest = hashlib.blake2b(view, digest_size=16).hexdigest()
+    elif isinstance(source, Path):
+        digest = hashlib.blake2b(source.read_bytes(), digest_size=16).hexdigest()
+    else:
+        return None
+    return cache_dir / f"{digest}.arrow"
+
+
+def _read_excel_source(source: Any, source_label: str) -> pl.DataFrame:
+    """Read the first non-empty sheet, trying calamine, openpyxl, then pandas."""
 
     try:
         if hasattr(pl, "read_excel"):
-            df = pl.read_excel(_excel_source(path_or_bytes))
+            df = pl.read_excel(_excel_source(source), engine="calamine")
             if not df.is_empty():
                 return df
-            # Empty frame from Polars; fall back to pandas for a second opinion.
-            print(f"polars.read_excel returned 0 rows for {source_label}; retrying with pandas.")
+            # Empty frame from Polars; look for the first sheet that has rows.
+            print(f"polars.read_excel returned 0 rows for {source_label}; probing other sheets.")
     except Exception as exc:  # pragma: no cover - delegated to fallback
-        # Fall back to pandas path if Polars excel reader is unavailable/unstable.
-        print(f"polars.read_excel failed for {source_label}; falling back to pandas. {exc}")
+        # Polars raises on an empty default sheet, or its excel reader may be unavailable.
+        print(f"polars.read_excel failed for {source_label}; probing sheets with calamine. {exc}")
+
+    try:
+        df, chosen_sheet = _read_first_nonempty_sheet_with_calamine(source)
+    except Exception as exc:  # pragma: no cover - delegated to fallback
+        # fastexcel missing or workbook unreadable by calamine; try polars' openpyxl engine.
+        print(f"calamine sheet probe failed for {source_label}; trying openpyxl. {exc}")
+    else:
+        print(f"Loaded sheet '{chosen_sheet}' for {source_label} via calamine.")
+        return df
+
+    try:
+        df, chosen_sheet = _read_first_nonempty_sheet_with_openpyxl(source)
+    except Exception as exc:  # pragma: no cover - delegated to fallback
+        print(f"openpyxl sheet read failed for {source_label}; falling back to pandas. {exc}")
+    else:
+        print(f"Loaded sheet '{chosen_sheet}' for {source_label} via openpyxl.")
+        return df
 
     # Fallback: pandas -> Polars
     try:
@@ -312,9 +524,9 @@ def load_excel_to_polars(path_or_bytes: Any) -> pl.DataFrame:
             "pandas is required to read Excel files when polars.read_excel is unavailable."
         ) from exc
 
-    pandas_df = pd.read_excel(_excel_source(path_or_bytes))
+    pandas_df = pd.read_excel(_excel_source(source))
     if pandas_df.empty:
-        pandas_df, chosen_sheet = _read_first_nonempty_sheet_with_pandas(path_or_bytes)
+        pandas_df, chosen_sheet = _read_first_nonempty_sheet_with_pandas(source)
         print(
             f"Default sheet was empty for {source_label}; loaded first non-empty sheet '{chosen_sheet}' instead."
         )
@@ -322,92 +534,93 @@ def load_excel_to_polars(path_or_bytes: Any) -> pl.DataFrame:
     return pl.from_pandas(pandas_df)
 
 
-def _select_and_rename(df: pl.DataFrame, mapping: Mapping[str, str]) -> pl.DataFrame:
-    """Select columns from df and rename them according to mapping."""
+def _select_and_rename(df: Frame, mapping: Mapping[str, str], table: str) -> Frame:
+    """Select columns from df and rename them according to mapping, applying the table's categorical columns."""
+
+    return df.select(table_select_exprs(table, mapping, df.collect_schema()))
 
-    exprs = []
-    for new_name, raw_name in mapping.items():
-        exprs.append(pl.col(raw_name).alias(new_name))
-    return df.select(exprs)
 
+def build_system_df(df: Frame, mapping: Mapping[str, str] = SYSTEM_COLS, *, sort: bool = True) -> Frame:
+    """Map System_* columns; unique on System_LOID.
 
-def build_system_df(df: pl.DataFrame, mapping: Mapping[str, str] = SYSTEM_COLS) -> pl.DataFrame:
-    """Map System_* columns; unique on System_LOID."""
+    unique() does not keep row order, so the frame is sorted by its keys unless
+    sort=False (for callers that only join or aggregate the result).
+    """
 
     _ensure_columns(df, mapping.values(), "System")
-    return (
-        _select_and_rename(df, mapping)
-        .unique(subset="System_LOID")
-        .sort("System_LOID")
-    )
+    frame = _select_and_rename(df, mapping, "system").unique(subset="System_LOID")
+    return frame.sort("System_LOID") if sort else frame
 
 
-def build_physport_df(df: pl.DataFrame, mapping: Mapping[str, str] = PHYSPORT_COLS) -> pl.DataFrame:
+def build_physport_df(df: Frame, mapping: Mapping[str, str] = PHYSPORT_COLS, *, sort: bool = True) -> Frame:
     """Map PhysicalPort_* columns with System foreign key."""
 
     _ensure_columns(df, mapping.values(), "PhysicalPort")
-    return (
-        _select_and_rename(df, mapping)
-        .unique(subset="PhysicalPort_LOID")
-        .sort(["System_LOID", "PhysicalPort_LOID"])
-    )
+    frame = _select_and_rename(df, mapping, "physport").unique(subset="PhysicalPort_LOID")
+    return frame.sort(["System_LOID", "PhysicalPort_LOID"]) if sort else frame
 
 
-def build_outputport_df(df: pl.DataFrame, mapping: Mapping[str, str] = OUTPUTPORT_COLS) -> pl.DataFrame:
+def build_outputport_df(df: Frame, mapping: Mapping[str, str] = OUTPUTPORT_COLS, *, sort: bool = True) -> Frame:
     """Map OutputPort_* columns with PhysicalPort foreign key."""
 
     _ensure_columns(df, mapping.values(), "OutputPort")
-    return (
-        _select_and_rename(df, mapping)
-        .unique(subset="OutputPort_LOID")
-        .sort(["PhysicalPort_LOID", "OutputPort_LOID"])
-    )
+    frame = _select_and_rename(df, mapping, "outputport").unique(subset="OutputPort_LOID")
+    return frame.sort(["PhysicalPort_LOID", "OutputPort_LOID"]) if sort else frame
 
 
-def build_wordstring_df(df: pl.DataFrame, mapping: Mapping[str, str] = WORDSTRING_COLS) -> pl.DataFrame:
+def build_wordstring_df(df: Frame, mapping: Mapping[str, str] = WORDSTRING_COLS, *, sort: bool = True) -> Frame:
     """Map Wordstring_* columns with OutputPort foreign key."""
 
     _ensure_columns(df, mapping.values(), "Wordstring")
-    return (
-        _select_and_rename(df, mapping)
-        .unique(subset=["Wordstring_LOID"])
-        .sort(["OutputPort_LOID", "Wordstring_LOID"])
-    )
+    frame = _select_and_rename(df, mapping, "wordstring").unique(subset=["Wordstring_LOID"])
+    return frame.sort(["OutputPort_LOID", "Wordstring_LOID"]) if sort else frame
 
 
-def build_word_df(df: pl.DataFrame, mapping: Mapping[str, str] = WORD_COLS) -> pl.DataFrame:
+def build_word_df(df: Frame, mapping: Mapping[str, str] = WORD_COLS, *, sort: bool = True) -> Frame:
     """Map per-word attributes; one row per word sequence number."""
 
     _ensure_columns(df, mapping.values(), "Word")
-    return (
-        _select_and_rename(df, mapping)
-        .unique(subset=["Wordstring_LOID", "Word_Seq_Num"])
-        .sort(["Wordstring_LOID", "Word_Seq_Num"])
-    )
+    frame = _select_and_rename(df, mapping, "word").unique(subset=["Wordstring_LOID", "Word_Seq_Num"])
+    return frame.sort(["Wordstring_LOID", "Word_Seq_Num"]) if sort else frame
 
 
-def build_parameter_df(df: pl.DataFrame, mapping: Mapping[str, str] = PARAMETER_COLS) -> pl.DataFrame:
+def build_parameter_df(df: Frame, mapping: Mapping[str, str] = PARAMETER_COLS, *, sort: bool = True) -> Frame:
     """Map parameter attributes; primary link via OutputPort_LOID."""
 
     _ensure_columns(df, mapping.values(), "Parameter")
-    return (
-        _select_and_rename(df, mapping)
-        .unique(subset=["Parameter_LOID"])
-        .sort(["OutputPort_LOID", "Parameter_LOID"])
-    )
+    frame = _select_and_rename(df, mapping, "parameter").unique(subset=["Parameter_LOID"])
+    return frame.sort(["OutputPort_LOID", "Parameter_LOID"]) if sort else frame
 
 
-def build_report_df(df: pl.DataFrame, mapping: Mapping[str, str] = REPORT_COLS) -> pl.DataFrame:
+def build_report_df(df: Frame, mapping: Mapping[str, str] = REPORT_COLS) -> Frame:
     """Map optional report/timestamp columns."""
 
     # Report columns are optional but included when present.
-    available_mapping = {k: v for k, v in mapping.items() if v in df.columns}
+    columns = set(df.collect_schema().names())
+    available_mapping = {k: v for k, v in mapping.items() if v in columns}
     if not available_mapping:
-        return pl.DataFrame()
-    return _select_and_rename(df, available_mapping)
+        return pl.LazyFrame() if isinstance(df, pl.LazyFrame) else pl.DataFrame()
+    return _select_and_rename(df, available_mapping, "report")
 
 
 @_cache_data
+def _normalize_icd_cached(
+    df: pl.DataFrame,
+    column_mappings: Mapping[str, Mapping[str, str]] | None,
+    fill_down: List[str] | None,
+    infer_fill_down: bool,
+    merge_with_defaults: bool,
+) -> tuple[Dict[str, pl.DataFrame], NormalizationReport]:
+    return normalize_icd_tables(
+        df,
+        column_mappings=column_mappings,
+        fill_down=fill_down,
+        infer_fill_down=infer_fill_down,
+        clean_headers=True,
+        merge_with_defaults=merge_with_defaults,
+    )
+
+
 def normalize_icd(
     df: pl.DataFrame,
     column_mappings: Mapping[str, Mapping[str, str]] | None = None,
@@ -424,14 +637,11 @@ def normalize_icd(
     (tables, report) when return_report=True.
     """
 
-    tables, report = normalize_icd_tables(
-        df,
-        column_mappings=column_mappings,
-        fill_down=fill_down,
-        infer_fill_down=infer_fill_down,
-        clean_headers=True,
-        merge_with_defaults=merge_with_defaults,
-    )
+    fill_down = None if fill_down is None else [str(col) for col in fill_down]
+    tables, report = _normalize_icd_cached(df, column_mappings, fill_down, infer_fill_down, merge_with_defaults)
+
+    # Hand out a fresh dict so a caller swapping tables does not alter the cached result.
+    tables = dict(tables)
     if return_report:
         return tables, report
     return tables
@@ -28,6 +28,8 @@ from icd_common.normalize import build_hierarchy_index
 DEFAULT_EXCEL_PATH = (
     Path(__file__).resolve().parent.parent / "sample_data" / "icd_flat_example.xlsx"
 )
+# Set to a directory to keep parsed workbooks as Arrow IPC files across restarts.
+EXCEL_CACHE_DIR: Path | None = None
 DEFAULT_MAPPING_PATH = Path(__file__).resolve().parent / "schema_mapping.json"
 
 
@@ -287,7 +289,7 @@ def load_data() -> tuple[pl.DataFrame, str]:
 
     if uploaded is not None:
         try:
-            df = load_excel_to_polars(uploaded)
+            df = load_excel_to_polars(uploaded, cache_dir=EXCEL_CACHE_DIR)
             source_label = uploaded.name or "uploaded Excel"
             return df, source_label
         except Exception as exc:  # pragma: no cover - handled in UI
@@ -300,7 +302,7 @@ def load_data() -> tuple[pl.DataFrame, str]:
         st.stop()
 
     try:
-        df = load_excel_to_polars(path_obj)
+        df = load_excel_to_polars(path_obj, cache_dir=EXCEL_CACHE_DIR)
         return df, str(path_obj)
     except Exception as exc:  # pragma: no cover - handled in UI
         st.error(f"Failed to read Excel file at {path_obj}: {exc}")
@@ -23,8 +23,11 @@ from .normalize import (  # noqa: F401
     NormalizationReport,
     apply_fill_down,
     build_hierarchy_index,
+    build_table_queries,
+    canonical_select_exprs,
     normalize_icd_tables,
     resolve_fill_down_raw,
+    table_select_exprs,
 )
 
 __all__ = [
@@ -44,6 +47,9 @@ __all__ = [
     "NormalizationReport",
     "apply_fill_down",
     "build_hierarchy_index",
+    "build_table_queries",
+    "canonical_select_exprs",
     "normalize_icd_tables",
     "resolve_fill_down_raw",
+    "table_select_exprs",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
 
 import polars as pl
@@ -9,6 +10,7 @@ from .schema import (
     DEFAULT_COLUMN_MAPS,
     DEFAULT_FILL_DOWN_CANONICAL,
     HIERARCHY_COLUMNS,
+    REQUIRED_TABLES,
     TABLE_SCHEMAS,
     canonical_to_raw,
     clean_header_name,
@@ -36,6 +38,98 @@ def normalize_headers(df: pl.DataFrame) -> pl.DataFrame:
     return df.rename(rename_map)
 
 
+# Per column: (raw name, plain aliased expr, categorical aliased expr or None).
+SelectPlan = Tuple[Tuple[str, pl.Expr, "pl.Expr | None"], ...]
+
+
+def _select_plan(mapping: Mapping[str, str], categorical: Iterable[str] = ()) -> SelectPlan:
+    """Build the rename expressions for a mapping, reusing them for equal mappings."""
+
+    return _compile_select_plan(tuple((str(k), str(v)) for k, v in mapping.items()), frozenset(categorical))
+
+
+@lru_cache(maxsize=64)
+def _compile_select_plan(items: Tuple[Tuple[str, str], ...], categorical: frozenset) -> SelectPlan:
+    # Keyed on the mapping's content, so custom/preset mappings reused across
+    # reruns skip rebuilding their expressions just like the defaults.
+    return tuple(
+        (
+            raw,
+            pl.col(raw).alias(canon),
+            pl.col(raw).cast(pl.Categorical).alias(canon) if canon in categorical else None,
+        )
+        for canon, raw in items
+    )
+
+
+def _plan_exprs(plan: SelectPlan, source_schema: Mapping[str, pl.DataType]) -> List[pl.Expr]:
+    return [
+        categorical_expr if categorical_expr is not None and source_schema.get(raw) == pl.String else plain_expr
+        for raw, plain_expr, categorical_expr in plan
+    ]
+
+
+# Default table mappings are compiled once at import; see table_select_exprs.
+_DEFAULT_SELECT_PLANS: Dict[str, SelectPlan] = {
+    name: _select_plan(schema.columns, schema.categorical) for name, schema in TABLE_SCHEMAS.items()
+}
+
+
+def canonical_select_exprs(
+    mapping: Mapping[str, str],
+    source_schema: Mapping[str, pl.DataType],
+    categorical: Iterable[str] = (),
+) -> List[pl.Expr]:
+    """
+    Select raw columns under their canonical names.
+
+    Canonical columns listed in categorical are cast to pl.Categorical when the
+    raw column holds strings; other dtypes are left alone so numeric cells are
+    not turned into text.
+    """
+
+    return _plan_exprs(_select_plan(mapping, categorical), source_schema)
+
+
+def table_select_exprs(
+    table: str,
+    mapping: Mapping[str, str],
+    source_schema: Mapping[str, pl.DataType],
+) -> List[pl.Expr]:
+    """
+    canonical_select_exprs for one schema table, using its categorical columns.
+
+    When mapping is the table's default column map (e.g. SYSTEM_COLS itself),
+    the expressions precompiled at import are reused.
+    """
+
+    schema = TABLE_SCHEMAS[table]
+    if mapping is schema.columns:
+        return _plan_exprs(_DEFAULT_SELECT_PLANS[table], source_schema)
+    return canonical_select_exprs(mapping, source_schema, schema.categorical)
+
+
+def _compact_int_columns(frame: pl.DataFrame, dtypes: Mapping[str, str]) -> pl.DataFrame:
+    """
+    Cast integer columns to the dtype declared for them in TableSchema.compact_ints.
+
+    A column whose values do not all fit the declared dtype stays Int64, as do
+    non-integer columns (e.g. floats from cells with blanks).
+    """
+
+    schema = frame.schema
+    casts = []
+    for col, dtype_name in dtypes.items():
+        if col not in schema or not schema[col].is_integer():
+            continue
+        column = frame[col]
+        cast = column.cast(getattr(pl, dtype_name), strict=False)
+        # Out-of-range values become null under strict=False
+        if cast.null_count() == column.null_count():
+            casts.append(cast)
+    return frame.with_columns(casts) if casts else frame
+
+
 def apply_fill_down(df: pl.DataFrame, columns: Iterable[str]) -> pl.DataFrame:
     """
     Forward-fill the given raw columns (empty string -> null -> forward fill).
@@ -121,6 +215,49 @@ def _infer_fill_down(df: pl.DataFrame, candidates: Iterable[str], sample_rows: i
     return _uniq(inferred)
 
 
+def _describe_missing(missing: Iterable[str], mapping: Mapping[str, Mapping[str, str]]) -> str:
+    """List missing raw columns, each followed by the required tables that map it."""
+
+    tables_for: Dict[str, List[str]] = {}
+    for table in REQUIRED_TABLES:
+        for raw in mapping.get(table, {}).values():
+            tables_for.setdefault(raw, []).append(table)
+    return ", ".join(f"{col} ({', '.join(_uniq(tables_for.get(col, [])))})" for col in sorted(missing))
+
+
+MappingKey = Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]
+
+
+def _mapping_key(column_mappings: Mapping[str, Mapping[str, str]] | None) -> MappingKey:
+    """Hashable, order-preserving snapshot of a table -> {canonical: raw} mapping."""
+
+    return tuple(
+        (table, tuple((str(k), str(v)) for k, v in cols.items()))
+        for table, cols in (column_mappings or {}).items()
+    )
+
+
+@lru_cache(maxsize=8)
+def _resolve_mapping(key: MappingKey, merge_with_defaults: bool, clean_headers: bool) -> Dict[str, Dict[str, str]]:
+    """
+    Merge/clean a column mapping once per distinct mapping content.
+
+    Keyed on the mapping's content rather than its identity, so an edited dict
+    is never served a stale result. The returned dict is shared between calls
+    and must be treated as read-only.
+    """
+
+    overrides = {table: dict(cols) for table, cols in key}
+    if merge_with_defaults:
+        mapping = merge_column_mappings(overrides, base=DEFAULT_COLUMN_MAPS)
+    else:
+        mapping = overrides or merge_column_mappings(None, base=DEFAULT_COLUMN_MAPS)
+
+    if clean_headers:
+        mapping = {tbl: {canon: clean_header_name(raw) for canon, raw in cols.items()} for tbl, cols in mapping.items()}
+    return mapping
+
+
 @dataclass
 class NormalizationReport:
     raw_row_count: int
@@ -130,6 +267,43 @@ class NormalizationReport:
     table_row_counts: Dict[str, int]
 
 
+def build_table_queries(
+    source: pl.LazyFrame,
+    mapping: Mapping[str, Mapping[str, str]],
+) -> Dict[str, pl.LazyFrame]:
+    """
+    Build one lazy select/unique/sort query per mapped table over a shared source.
+
+    source must already have cleaned headers and fill-down applied. Nothing is
+    read until the queries are collected, so callers can add filters first or
+    collect them together with pl.collect_all. The optional report table is
+    omitted when none of its columns are present.
+    """
+
+    source_schema = source.collect_schema()
+    queries: Dict[str, pl.LazyFrame] = {}
+
+    for name, schema in TABLE_SCHEMAS.items():
+        if name not in mapping:
+            continue
+        # Report table is optional; skip if none of its columns exist.
+        if name == "report":
+            available = {k: v for k, v in mapping[name].items() if v in source_schema}
+            if not available:
+                continue
+            queries[name] = source.select(canonical_select_exprs(available, source_schema, schema.categorical))
+            continue
+
+        selected = source.select(canonical_select_exprs(mapping[name], source_schema, schema.categorical))
+        if schema.keys:
+            key_list = list(schema.keys)
+            selected = selected.unique(subset=key_list)
+            selected = selected.sort(key_list)
+        queries[name] = selected
+
+    return queries
+
+
 def normalize_icd_tables(
     df: pl.DataFrame,
     column_mappings: Mapping[str, Mapping[str, str]] | None = None,
@@ -153,24 +327,17 @@ def normalize_icd_tables(
     - When return_flat=True, also returns the cleaned/fill-down-applied flat frame
     """
 
-    if merge_with_defaults:
-        mapping = merge_column_mappings(column_mappings, base=DEFAULT_COLUMN_MAPS)
-    else:
-        mapping = {tbl: {str(k): str(v) for k, v in cols.items()} for tbl, cols in (column_mappings or {}).items()}
-        if not mapping:
-            mapping = merge_column_mappings(None, base=DEFAULT_COLUMN_MAPS)
-
-    if clean_headers:
-        mapping = {tbl: {canon: clean_header_name(raw) for canon, raw in cols.items()} for tbl, cols in mapping.items()}
+    mapping = _resolve_mapping(_mapping_key(column_mappings), merge_with_defaults, clean_headers)
     raw_row_count = df.height
 
     if clean_headers:
         df = normalize_headers(df)
 
-    required_cols = schema_required_raw_columns(mapping)
-    missing = [col for col in required_cols if col not in df.columns]
+    # df.columns builds a fresh list on each access; look columns up in one set.
+    columns = set(df.columns)
+    missing = schema_required_raw_columns(mapping) - columns
     if missing:
-        raise ValueError(f"Missing required columns: {', '.join(sorted(missing))}")
+        raise ValueError(f"Missing required columns: {_describe_missing(missing, mapping)}")
 
     fill_down_raw, fill_down_canonical = resolve_fill_down_raw(mapping, fill_down, include_defaults=True)
 
@@ -188,33 +355,17 @@ def normalize_icd_tables(
 
     df = apply_fill_down(df, fill_down_raw)
 
-    tables: Dict[str, pl.DataFrame] = {}
-    table_row_counts: Dict[str, int] = {}
-
-    for name, schema in TABLE_SCHEMAS.items():
-        if name not in mapping:
-            continue
-        # Report table is optional; skip if none of its columns exist.
-        if name == "report":
-            available = {k: v for k, v in mapping[name].items() if v in df.columns}
-            if not available:
-                tables[name] = pl.DataFrame()
-                table_row_counts[name] = 0
-                continue
-            selected = df.select([pl.col(raw).alias(canon) for canon, raw in available.items()])
-            tables[name] = selected
-            table_row_counts[name] = selected.height
-            continue
-
-        mapped_cols = mapping[name]
-        exprs = [pl.col(raw).alias(canon) for canon, raw in mapped_cols.items()]
-        selected = df.select(exprs)
-        if schema.keys:
-            key_list = list(schema.keys)
-            selected = selected.unique(subset=key_list)
-            selected = selected.sort(key_list)
-        tables[name] = selected
-        table_row_counts[name] = selected.height
+    # Build every table projection as a lazy query over the same frame and
+    # collect them together, so Polars plans them as one batch instead of
+    # materializing each select/unique/sort in turn.
+    queries = build_table_queries(df.lazy(), mapping)
+    collected = dict(zip(queries, pl.collect_all(list(queries.values()))))
+    tables: Dict[str, pl.DataFrame] = {
+        name: _compact_int_columns(collected.get(name, pl.DataFrame()), schema.compact_ints)
+        for name, schema in TABLE_SCHEMAS.items()
+        if name in mapping
+    }
+    table_row_counts: Dict[str, int] = {name: frame.height for name, frame in tables.items()}
 
     report = NormalizationReport(
         raw_row_count=raw_row_count,
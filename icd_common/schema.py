@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Mapping, MutableMapping, Sequence
 
 
@@ -43,6 +43,11 @@ class TableSchema:
     columns: Mapping[str, str]  # canonical -> raw column name
     keys: Sequence[str]
     fill_down: Sequence[str] = ()
+    # Low-cardinality text columns stored as pl.Categorical after selection.
+    categorical: Sequence[str] = ()
+    # Small integer columns -> Polars dtype name they are stored as. The dtype is
+    # fixed per column so every workbook's tables join and concat alike.
+    compact_ints: Mapping[str, str] = field(default_factory=dict)
 
 
 SYSTEM_COLS: Mapping[str, str] = {
@@ -144,6 +149,7 @@ def _table_schema() -> Dict[str, TableSchema]:
             SYSTEM_COLS,
             keys=("System_LOID",),
             fill_down=("System_LOID", "System_Name", "System_Bus"),
+            categorical=("System_Bus",),
         ),
         "physport": TableSchema(
             "physport",
@@ -175,6 +181,7 @@ def _table_schema() -> Dict[str, TableSchema]:
                 "OutputPort_SSW",
                 "OutputPort_Label",
             ),
+            compact_ints={"OutputPort_Rate_ms": "Int32", "OutputPort_StrikeCnt": "Int16"},
         ),
         "wordstring": TableSchema(
             "wordstring",
@@ -188,6 +195,8 @@ def _table_schema() -> Dict[str, TableSchema]:
                 "Wordstring_Mnemonic",
                 "Wordstring_TotalWords",
             ),
+            categorical=("Wordstring_Type",),
+            compact_ints={"Wordstring_TotalWords": "Int16"},
         ),
         "word": TableSchema(
             "word",
@@ -204,6 +213,13 @@ def _table_schema() -> Dict[str, TableSchema]:
                 "Word_Bit_Length",
                 "Word_PVB",
             ),
+            categorical=("Word_Type", "Word_Bit_Type"),
+            compact_ints={
+                "Word_Seq_Num": "Int16",
+                "Word_Start_Bit": "Int16",
+                "Word_CalcEnd_Bit": "Int16",
+                "Word_Bit_Length": "Int16",
+            },
         ),
         "parameter": TableSchema(
             "parameter",
@@ -240,6 +256,7 @@ def _table_schema() -> Dict[str, TableSchema]:
                 "Parameter_Latency_ms",
                 "Parameter_Description",
             ),
+            categorical=("Parameter_DataType", "Parameter_Units", "Parameter_PosSense"),
         ),
         "report": TableSchema(
             "report",
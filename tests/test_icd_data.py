@@ -10,9 +10,11 @@ from icd_browser.icd_data import (
     load_column_mappings,
     load_mapping_presets,
     apply_fill_down,
+    build_word_df,
     normalize_icd,
 )
-from icd_common.normalize import normalize_icd_tables
+from icd_common.normalize import build_table_queries, normalize_icd_tables
+from icd_common.schema import WORD_COLS
 import polars as pl
 
 
@@ -139,6 +141,12 @@ def test_normalize_icd_infers_fill_down_and_preserves_row_counts():
     assert tables["word"]["Wordstring_LOID"].null_count() == 0
     # Row-count regression guard: word rows should match raw rows in this flat export
     assert report.table_row_counts["word"] == raw.height
+    # Low-cardinality text columns are stored as categoricals.
+    assert tables["system"].schema["System_Bus"] == pl.Categorical
+    assert tables["wordstring"].schema["Wordstring_Type"] == pl.Categorical
+    # Small integer columns get their declared fixed dtype, whatever their values.
+    assert tables["word"].schema["Word_Seq_Num"] == pl.Int16
+    assert tables["word"]["Word_Seq_Num"].to_list() == [1, 2, 3]
 
 
 def test_normalize_icd_tables_can_return_flat_frame():
@@ -172,3 +180,79 @@ def test_normalize_icd_tables_can_return_flat_frame():
     assert flat.height == 2  # original row count preserved
     assert tables["system"].height == 1
     assert tables["word"].height == 2
+
+
+def test_normalize_icd_tables_picks_up_edited_mapping():
+    """Mapping resolution is cached by content, so editing the dict must not reuse the old result."""
+
+    raw = pl.DataFrame(
+        {
+            "Sys": ["SYS1"],
+            "Sys Renamed": ["SYS2"],
+            "Phys": ["P1"],
+            "Out": ["O1"],
+            "WS": ["WS1"],
+            "Seq": [1],
+            "Param": ["PA"],
+        }
+    )
+    mapping = {
+        "system": {"System_LOID": "Sys"},
+        "physport": {"PhysicalPort_LOID": "Phys", "System_LOID": "Sys"},
+        "outputport": {"OutputPort_LOID": "Out", "PhysicalPort_LOID": "Phys"},
+        "wordstring": {"Wordstring_LOID": "WS", "OutputPort_LOID": "Out"},
+        "word": {"Wordstring_LOID": "WS", "Word_Seq_Num": "Seq"},
+        "parameter": {"Parameter_LOID": "Param", "OutputPort_LOID": "Out"},
+    }
+
+    first, _ = normalize_icd_tables(raw, column_mappings=mapping, merge_with_defaults=False)
+    mapping["system"]["System_LOID"] = "Sys Renamed"
+    second, _ = normalize_icd_tables(raw, column_mappings=mapping, merge_with_defaults=False)
+
+    assert first["system"]["System_LOID"].to_list() == ["SYS1"]
+    assert second["system"]["System_LOID"].to_list() == ["SYS2"]
+
+
+def test_build_table_queries_stay_lazy_and_accept_filters():
+    raw = pl.DataFrame({"Sys": ["S1", "S2", "S1"], "Bus": ["LEFT", "RIGHT", "LEFT"]})
+    mapping = {"system": {"System_LOID": "Sys", "System_Bus": "Bus"}, "report": {"Col_59": "col_59"}}
+
+    queries = build_table_queries(raw.lazy(), mapping)
+
+    assert set(queries) == {"system"}  # report skipped: none of its columns exist
+    assert isinstance(queries["system"], pl.LazyFrame)
+    picked = queries["system"].filter(pl.col("System_LOID") == "S2").collect()
+    assert picked["System_Bus"].cast(pl.Utf8).to_list() == ["RIGHT"]
+
+
+def test_build_word_df_keeps_lazy_inputs_lazy():
+    raw = pl.DataFrame({raw_name: [1, 1, 2] for raw_name in WORD_COLS.values()})
+
+    lazy = build_word_df(raw.lazy())
+
+    assert isinstance(lazy, pl.LazyFrame)
+    assert lazy.collect().equals(build_word_df(raw))
+
+
+def test_load_excel_to_polars_reuses_disk_cache(tmp_path):
+    buffer = BytesIO()
+    pd.DataFrame({"A": [1, 2], "B": ["x", "y"]}).to_excel(buffer, index=False)
+    cache_dir = Path(tmp_path) / "excel_cache"
+
+    first = load_excel_to_polars(buffer.getvalue(), cache_dir=cache_dir)
+    cached_files = list(cache_dir.glob("*.arrow"))
+    second = load_excel_to_polars(BytesIO(buffer.getvalue()), cache_dir=cache_dir)
+
+    assert len(cached_files) == 1
+    assert second.equals(first)
+
+
+def test_normalize_icd_tables_names_tables_for_missing_columns():
+    raw = pl.DataFrame({"Phys": ["P1"]})
+    mapping = {
+        "system": {"System_LOID": "Sys"},
+        "physport": {"PhysicalPort_LOID": "Phys", "System_LOID": "Sys"},
+    }
+
+    with pytest.raises(ValueError, match=r"Missing required columns: Sys \(system, physport\)"):
+        normalize_icd_tables(raw, column_mappings=mapping, merge_with_defaults=False)